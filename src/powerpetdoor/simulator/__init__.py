@@ -31,7 +31,6 @@ Example usage:
 from .state import DoorSimulatorState, Schedule, DoorTimingConfig, BatteryConfig
 from .protocol import DoorSimulatorProtocol, CommandRegistry
 from .server import DoorSimulator
-from .cli import run_simulator, main
 from .commands import CommandHandler, CommandResult
 from .scripting import (
     Script,
@@ -43,6 +42,21 @@ from .scripting import (
     list_builtin_scripts,
 )
 
+
+def __getattr__(name: str):
+    """Lazily import the CLI entry points.
+
+    The CLI pulls in prompt_toolkit, so it is only loaded when one of its
+    entry points is actually requested (keeps ppd-simulator-ctl one-shot
+    commands fast to start).
+    """
+    if name in ("run_simulator", "main"):
+        from . import cli
+
+        return getattr(cli, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     # Main classes
     "DoorSimulator",
@@ -15,20 +15,19 @@ import sys
 from typing import TYPE_CHECKING, Optional
 
 from .commands import CommandHandler
-from .server import DoorSimulator
-from ..tz_utils import async_init_timezone_cache
-
-# Import shared prompt_toolkit components
-from .prompt_common import (
-    PROMPT_TOOLKIT_AVAILABLE,
+from .commands.history import (
     CLI_HISTORY_FILE as HISTORY_FILE,
-    InteractiveSession,
+    prompt_toolkit_available,
 )
+from .server import DoorSimulator
+from ..tz_utils import async_init_timezone_cache
 
-if PROMPT_TOOLKIT_AVAILABLE:
-    from prompt_toolkit.patch_stdout import patch_stdout
+# The shared prompt_toolkit components in prompt_common are imported only
+# when an interactive session starts, so script and daemon runs don't pay
+# for them.
 
 if TYPE_CHECKING:
+    from .prompt_common import InteractiveSession
     from .scripting import ScriptRunner
 
 logger = logging.getLogger(__name__)
@@ -182,7 +181,7 @@ async def run_simulator(
 
     # Holder for interactive session (set later if in interactive mode)
     # Used by callbacks to invalidate prompt on connect/disconnect
-    session_holder: list[Optional[InteractiveSession]] = [None]
+    session_holder: list[Optional["InteractiveSession"]] = [None]
 
     def on_client_connect():
         """Called when a client connects - invalidate prompt to update color."""
@@ -425,7 +424,11 @@ async def run_simulator(
             pass
 
         if stdin_available:
+            from .prompt_common import PROMPT_TOOLKIT_AVAILABLE, InteractiveSession
+
             if PROMPT_TOOLKIT_AVAILABLE:
+                from prompt_toolkit.patch_stdout import patch_stdout
+
                 # Use InteractiveSession.create for standard prompt setup
                 history_path = history_file if history_file else str(HISTORY_FILE)
                 interactive = InteractiveSession.create(
@@ -549,8 +552,8 @@ async def run_simulator(
         if stdout_ctx:
             stdout_ctx.__exit__(None, None, None)
         if prompt:
+            # Basic input fallback: stop reading stdin
             prompt.disable()
-        if interactive and stdin_available and not PROMPT_TOOLKIT_AVAILABLE:
             try:
                 loop.remove_reader(sys.stdin.fileno())
             except Exception:
@@ -649,13 +652,19 @@ def main():
         help="Maximum run time in seconds (--oneshot can exit earlier)"
     )
     # Only add history argument if prompt_toolkit is available
-    if PROMPT_TOOLKIT_AVAILABLE:
+    has_prompt_toolkit = prompt_toolkit_available()
+    if has_prompt_toolkit:
         parser.add_argument(
             "--history",
             metavar="FILE",
             default=str(HISTORY_FILE),
             help=f"History file path, or 'none' to disable (default: {HISTORY_FILE})"
         )
+    parser.add_argument(
+        "--no-uvloop",
+        action="store_true",
+        help="Use the standard asyncio event loop even if uvloop is installed"
+    )
     parser.add_argument(
         "--firmware", "-f",
         metavar="VERSION",
@@ -670,7 +679,7 @@ def main():
     args = parser.parse_args()
 
     # Set history_file to None if prompt_toolkit not available
-    if not PROMPT_TOOLKIT_AVAILABLE:
+    if not has_prompt_toolkit:
         args.history = None
 
     logging.basicConfig(
@@ -718,22 +727,33 @@ def main():
             parser.error("Hardware version must be in format ver.rev (e.g., '1.1')")
         hardware = (parts[0], parts[1])
 
+    # Run on uvloop if it is installed, unless asked not to
+    loop_factory = None
+    if not args.no_uvloop:
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            loop_factory = uvloop.new_event_loop
+
     try:
-        result = asyncio.run(run_simulator(
-            host=args.host,
-            port=args.port,
-            scripts=args.scripts,
-            loop_scripts=args.loop,
-            script_delay=args.script_delay,
-            oneshot=args.oneshot,
-            daemon=daemon,
-            run_for=args.run_for,
-            wait_for_client=args.wait_for_client,
-            control_port=control_port,
-            history_file=args.history,
-            firmware=firmware,
-            hardware=hardware,
-        ))
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            result = runner.run(run_simulator(
+                host=args.host,
+                port=args.port,
+                scripts=args.scripts,
+                loop_scripts=args.loop,
+                script_delay=args.script_delay,
+                oneshot=args.oneshot,
+                daemon=daemon,
+                run_for=args.run_for,
+                wait_for_client=args.wait_for_client,
+                control_port=control_port,
+                history_file=args.history,
+                firmware=firmware,
+                hardware=hardware,
+            ))
 
         # Exit with appropriate code for CI/CD
         if args.oneshot and result is not None:
@@ -9,12 +9,22 @@ Provides a unified History class that encapsulates all history functionality
 and can be used by both the interactive CLI and the control client.
 """
 
+import importlib.util
 import logging
 from pathlib import Path
 from typing import Any, Optional, Union
 
 logger = logging.getLogger(__name__)
 
+# History file paths
+CLI_HISTORY_FILE = Path.home() / ".powerpetdoor_simulator_history"
+CTL_HISTORY_FILE = Path.home() / ".powerpetdoor_ctl_history"
+
+
+def prompt_toolkit_available() -> bool:
+    """Check whether prompt_toolkit is installed without importing it."""
+    return importlib.util.find_spec("prompt_toolkit") is not None
+
 
 class History:
     """Manages command history for interactive sessions.
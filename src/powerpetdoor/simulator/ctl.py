@@ -12,27 +12,28 @@ main CLI for consistent syntax highlighting and tab completion.
 
 import argparse
 import asyncio
+import errno
+import os
+import select
 import socket
 import sys
 from typing import Optional
 
 from ..tz_utils import async_init_timezone_cache
 
-# Import shared prompt_toolkit components
-from .prompt_common import (
-    PROMPT_TOOLKIT_AVAILABLE,
-    CTL_HISTORY_FILE as HISTORY_FILE,
-    InteractiveSession,
-    InputLine,
-)
-
-# Import command infrastructure for local command handling
+# Import command infrastructure for local command handling. The shared
+# prompt_toolkit components in prompt_common are imported lazily by the
+# interactive modes so one-shot commands don't pay for them.
 from .commands.base import (
     CommandResult,
     get_command_registry,
     parse_arg,
 )
-from .commands.history import History
+from .commands.history import (
+    CTL_HISTORY_FILE as HISTORY_FILE,
+    History,
+    prompt_toolkit_available,
+)
 from .commands.info import InfoCommandsMixin
 from .commands.control import ControlCommandsMixin
 
@@ -118,7 +119,10 @@ class LocalCommandHandler(InfoCommandsMixin, ControlCommandsMixin):
         if not parts:
             return LocalCommandResult(False, "Empty command")
 
-        cmd = parts[0].lower()
+        # Lowercase once for all keyword comparisons; original case is kept
+        # in parts for argument parsing
+        parts_lower = [p.lower() for p in parts]
+        cmd = parts_lower[0]
 
         # Look up command in registry
         if cmd not in registry:
@@ -130,7 +134,7 @@ class LocalCommandHandler(InfoCommandsMixin, ControlCommandsMixin):
         # Traverse subcommand hierarchy
         part_idx = 1
         while part_idx < len(parts) and info.subcommands:
-            subcmd = parts[part_idx].lower()
+            subcmd = parts_lower[part_idx]
 
             # Handle implicit help/? subcommand
             if subcmd in ("help", "?"):
@@ -172,7 +176,7 @@ class LocalCommandHandler(InfoCommandsMixin, ControlCommandsMixin):
         try:
             if info.args:
                 # Check for help request as first arg
-                if remaining_parts and remaining_parts[0].lower() in ("help", "?"):
+                if part_idx < len(parts) and parts_lower[part_idx] in ("help", "?"):
                     help_text = self._get_arg_help(info, cmd_path)
                     return LocalCommandResult(True, help_text)
 
@@ -219,8 +223,29 @@ class LocalCommandHandler(InfoCommandsMixin, ControlCommandsMixin):
         return parsed, None
 
 
-if PROMPT_TOOLKIT_AVAILABLE:
-    from prompt_toolkit.patch_stdout import patch_stdout
+# Upper bound on a single control port response, so a misbehaving daemon
+# that never terminates its reply can't grow the buffer without limit
+MAX_RESPONSE_SIZE = 1 << 20  # 1 MiB
+
+
+# TCP keepalive for the persistent interactive connection, so a daemon or
+# NAT that silently drops the connection is noticed without sending a command
+KEEPALIVE_IDLE = 30  # Seconds idle before the first probe
+KEEPALIVE_INTERVAL = 10  # Seconds between probes
+KEEPALIVE_COUNT = 3  # Failed probes before the connection is dropped
+
+
+def _enable_keepalive(sock: socket.socket) -> None:
+    """Enable TCP keepalive on a socket, tuning the timers where supported."""
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    # Timer options are platform-specific (TCP_KEEPIDLE is Linux-only)
+    for opt, value in (
+        ("TCP_KEEPIDLE", KEEPALIVE_IDLE),
+        ("TCP_KEEPINTVL", KEEPALIVE_INTERVAL),
+        ("TCP_KEEPCNT", KEEPALIVE_COUNT),
+    ):
+        if hasattr(socket, opt):
+            sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, opt), value)
 
 
 def send_command(
@@ -247,13 +272,15 @@ def send_command(
             sock.sendall(f"{command}\n".encode())
 
             # Read response
-            response = b""
+            response = bytearray()
             while True:
                 try:
                     chunk = sock.recv(4096)
                     if not chunk:
                         break
                     response += chunk
+                    if len(response) > MAX_RESPONSE_SIZE:
+                        return False, "Response too large"
                     # Check if we got a complete response (OK: or ERROR:)
                     decoded = response.decode()
                     # Look for complete response line
@@ -284,21 +311,30 @@ def send_command(
         return False, f"Error: {e}"
 
 
-def check_connection(host: str, port: int, timeout: float = 2.0) -> tuple[bool, str]:
+def check_connection(host: str, port: int, timeout: float = 1.0) -> tuple[bool, str]:
     """Check if the simulator is listening.
 
+    Uses a non-blocking connect bounded by ``timeout`` so an unreachable host
+    fails within the given budget instead of waiting on the kernel's SYN
+    retry schedule.
+
     Returns:
         Tuple of (connected, error_message)
     """
     try:
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.settimeout(timeout)
-            sock.connect((host, port))
+            sock.setblocking(False)
+            err = sock.connect_ex((host, port))
+            if err in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                _, writable, _ = select.select([], [sock], [], timeout)
+                if not writable:
+                    return False, f"Connection timed out to {host}:{port}"
+                err = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+            if err == errno.ECONNREFUSED:
+                return False, f"Connection refused - simulator not running on {host}:{port}"
+            if err:
+                return False, f"Connection error: {os.strerror(err)}"
             return True, ""
-    except ConnectionRefusedError:
-        return False, f"Connection refused - simulator not running on {host}:{port}"
-    except socket.timeout:
-        return False, f"Connection timed out to {host}:{port}"
     except Exception as e:
         return False, f"Connection error: {e}"
 
@@ -307,6 +343,8 @@ async def interactive_mode_async(
     host: str, port: int, door_port: int, timeout: float, history_file: Optional[str]
 ):
     """Run in interactive mode using asyncio with log streaming."""
+    from .prompt_common import PROMPT_TOOLKIT_AVAILABLE, InputLine, InteractiveSession
+
     # Initialize timezone cache for completion
     await async_init_timezone_cache()
 
@@ -322,18 +360,32 @@ async def interactive_mode_async(
 
     # Connect with asyncio for persistent connection
     try:
-        reader, writer = await asyncio.open_connection(host, port)
+        reader, writer = await asyncio.open_connection(host, port, limit=MAX_RESPONSE_SIZE)
     except Exception as e:
         print(f"Error connecting: {e}")
         sys.exit(1)
 
+    sock = writer.get_extra_info("socket")
+    if sock is not None:
+        try:
+            _enable_keepalive(sock)
+        except OSError:
+            pass  # Keepalive is best-effort
+
     stop_event = asyncio.Event()
 
     # Track client connection status for prompt coloring
     has_clients = [False]
 
-    # Queue for command responses (OK:/ERROR: messages)
-    response_queue: asyncio.Queue[tuple[bool, str]] = asyncio.Queue()
+    # Future for the single outstanding command response (OK:/ERROR: messages).
+    # Responses that arrive while no command is in flight are dropped.
+    inflight: list[Optional[asyncio.Future[tuple[bool, str]]]] = [None]
+
+    def resolve_inflight(success: bool, msg: str) -> None:
+        """Complete the in-flight command future, if any."""
+        fut = inflight[0]
+        if fut is not None and not fut.done():
+            fut.set_result((success, msg))
 
     # Set up interactive session using shared InteractiveSession class
     interactive = InteractiveSession.create(
@@ -351,7 +403,7 @@ async def interactive_mode_async(
 
         Routes messages to appropriate handlers:
         - LOG: messages are printed immediately
-        - OK:/ERROR: messages go to the response queue
+        - OK:/ERROR: messages complete the in-flight command future
         """
         try:
             while not stop_event.is_set():
@@ -382,8 +434,7 @@ async def interactive_mode_async(
                     elif decoded.startswith("OK:"):
                         # Unescape newlines from protocol
                         msg = decoded[4:].replace('\\n', '\n').replace('\\\\', '\\')
-                        # Route to response queue
-                        await response_queue.put((True, msg))
+                        resolve_inflight(True, msg)
                         # Update client count from status responses
                         if "Clients:" in decoded:
                             old_status = has_clients[0]
@@ -396,7 +447,7 @@ async def interactive_mode_async(
                     elif decoded.startswith("ERROR:"):
                         # Unescape newlines from protocol
                         msg = decoded[7:].replace('\\n', '\n').replace('\\\\', '\\')
-                        await response_queue.put((False, msg))
+                        resolve_inflight(False, msg)
                 except asyncio.CancelledError:
                     break
         except asyncio.CancelledError:
@@ -407,28 +458,22 @@ async def interactive_mode_async(
                 stop_event.set()
 
     async def send_command_async(cmd: str) -> tuple[bool, str]:
-        """Send a command and wait for response from the queue."""
+        """Send a command and wait for the reader task to deliver its response."""
+        fut: asyncio.Future[tuple[bool, str]] = asyncio.get_running_loop().create_future()
+        inflight[0] = fut
         try:
-            # Clear any stale responses from the queue
-            while not response_queue.empty():
-                try:
-                    response_queue.get_nowait()
-                except asyncio.QueueEmpty:
-                    break
-
             writer.write(f"{cmd}\n".encode())
             await writer.drain()
 
             # Wait for response from the reader task
             try:
-                success, response = await asyncio.wait_for(
-                    response_queue.get(), timeout=timeout
-                )
-                return success, response
+                return await asyncio.wait_for(fut, timeout=timeout)
             except asyncio.TimeoutError:
                 return False, "Response timeout"
         except Exception as e:
             return False, f"Error: {e}"
+        finally:
+            inflight[0] = None
 
     # Start the socket reader task
     reader_task = asyncio.create_task(socket_reader())
@@ -436,6 +481,8 @@ async def interactive_mode_async(
     # Use patch_stdout if available for proper prompt handling with async output
     stdout_ctx = None
     if PROMPT_TOOLKIT_AVAILABLE:
+        from prompt_toolkit.patch_stdout import patch_stdout
+
         stdout_ctx = patch_stdout()
         stdout_ctx.__enter__()
 
@@ -505,10 +552,13 @@ async def interactive_mode_async(
                 continue
 
             # Handle history recall commands (!!, !n, !-n)
-            resolved_line, was_history_recall, error = interactive.resolve_history_recall(line)
-            if error:
-                print(f">>> {error}")
-                continue
+            if line[0] == "!":
+                resolved_line, was_history_recall, error = interactive.resolve_history_recall(line)
+                if error:
+                    print(f">>> {error}")
+                    continue
+            else:
+                resolved_line, was_history_recall = line, False
 
             input_line = InputLine(
                 original=line,
@@ -665,7 +715,7 @@ Use the 'help' command to see available simulator commands.
         default=5.0,
         help="Command timeout in seconds (default: 5)",
     )
-    if PROMPT_TOOLKIT_AVAILABLE:
+    if prompt_toolkit_available():
         parser.add_argument(
             "--history",
             metavar="FILE",
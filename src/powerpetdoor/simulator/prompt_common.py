@@ -9,12 +9,16 @@ This module provides syntax highlighting, tab completion, styling, and
 the InteractiveSession class for the simulator command-line interfaces.
 """
 
+import collections
+import functools
+import inspect
+import itertools
+import re
 from dataclasses import dataclass
-from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Optional
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Optional, Sequence
 
 from .commands.base import get_command_registry, get_canonical_command
-from .commands.history import History
+from .commands.history import CLI_HISTORY_FILE, CTL_HISTORY_FILE, History  # noqa: F401
 
 # Import CommandHandler to ensure all command modules are loaded and their
 # @command/@subcommand decorators populate the registry. This is needed for
@@ -36,10 +40,6 @@ if TYPE_CHECKING:
     from prompt_toolkit.lexers import Lexer
     from prompt_toolkit.styles import Style
 
-# History file paths
-CLI_HISTORY_FILE = Path.home() / ".powerpetdoor_simulator_history"
-CTL_HISTORY_FILE = Path.home() / ".powerpetdoor_ctl_history"
-
 # Style for syntax highlighting
 SIMULATOR_STYLE = (
     Style.from_dict(
@@ -60,57 +60,380 @@ SIMULATOR_STYLE = (
     else None
 )
 
-# Command categories for syntax highlighting (populated dynamically)
-_COMMANDS: set[str] = set()
-_ALIASES: set[str] = set()
-_SUBCOMMANDS: set[str] = set()
-_OPTIONS: set[str] = set()
+# Precompiled patterns for the lexer: a word is any run of non-whitespace,
+# and a number is digits mixed with the separators used by times (6:00),
+# ranges (6-22) and decimals (1.5), with at least one digit
+_WORD_RE = re.compile(r"\S+")
+_NUMBER_RE = re.compile(r"[.:-]*\d[\d.:-]*")
 
+# Command categories for syntax highlighting (populated dynamically, and
+# frozen since the registry doesn't change once commands are loaded)
+_COMMANDS: frozenset[str] = frozenset()
+_ALIASES: frozenset[str] = frozenset()
+_SUBCOMMANDS: frozenset[str] = frozenset()
+_OPTIONS: frozenset[str] = frozenset()
+_initialized = False
 
-def _collect_subcommands_and_options(subcommands: dict) -> None:
-    """Recursively collect subcommand names and options from a subcommand registry."""
-    for info in subcommands.values():
-        _SUBCOMMANDS.add(info.name)
-        for alias in info.aliases:
-            _SUBCOMMANDS.add(alias)
-        # Collect choices from args (any arg type with choices, not just "choice" type)
-        for arg in info.args:
-            if arg.arg_type == "bool_toggle":
-                _OPTIONS.update(["on", "off"])
-            elif arg.choices:
-                _OPTIONS.update(c.lower() for c in arg.choices)
-        # Recurse into nested subcommands
-        if info.subcommands:
-            _collect_subcommands_and_options(info.subcommands)
+# Style for a line's first word by lowercased command or alias, so the lexer
+# classifies it with a single lookup (populated with the command sets)
+_TOKEN_STYLE: dict[str, str] = {}
+
+# Fixed first-argument completions (on/off, choices) per CommandInfo, keyed
+# by id() since CommandInfo isn't hashable (populated with the command sets)
+_ARG_OPTIONS: dict[int, tuple[tuple[str, str], ...]] = {}
+
+# Most words a command path can span: the command, its deepest subcommand
+# chain and a trailing help/? (updated with the command sets)
+_MAX_PATH_WORDS = 2
+
+
+# Completions for bool_toggle arguments, shared by every such argument
+_TOGGLE_OPTIONS = (("on", "Enable"), ("off", "Disable"))
+_TOGGLE_WORDS = frozenset(name for name, _ in _TOGGLE_OPTIONS)
+
+
+def _static_arg_options(info) -> tuple[tuple[str, str], ...]:
+    """Get the fixed completions for a command's first argument, if any."""
+    if not info.args:
+        return ()
+    arg = info.args[0]
+    if arg.arg_type == "bool_toggle":
+        return _TOGGLE_OPTIONS
+    # Any arg type with choices (e.g. history's "clear" on a string arg)
+    if arg.choices:
+        return tuple((c.lower(), c) for c in arg.choices)
+    return ()
+
+
+def _arg_option_words(info) -> Iterator[str]:
+    """Yield the lowercased option words accepted by a command's choice arguments.
+
+    bool_toggle words are constant and added once by init_command_sets.
+    """
+    for arg in info.args:
+        if arg.choices and arg.arg_type != "bool_toggle":
+            # Any arg type with choices, not just "choice" type
+            yield from (c.lower() for c in arg.choices)
+
+
+def _collect_subcommands_and_options(
+    subcommands: dict,
+    subcommand_names: set[str],
+    options: set[str],
+    arg_options: dict[int, tuple[tuple[str, str], ...]],
+) -> int:
+    """Collect subcommand names and options from a subcommand registry.
+
+    Walks nested subcommands breadth-first.
+
+    Args:
+        subcommands: Subcommand registry to collect from
+        subcommand_names: Set to add subcommand names and aliases to
+        options: Set to add lowercased argument choices to
+        arg_options: Dict to add each subcommand's fixed first-argument
+            completions to, keyed by id()
+
+    Returns:
+        How many words the longest command path through these subcommands
+        spans, including a trailing help/?.
+    """
+    max_path_words = 0
+    # Each entry is a registry and the command path length up to its subcommands
+    queue = collections.deque([(subcommands, 2)])
+    while queue:
+        registry, depth = queue.popleft()
+        # Leave room for a help/? after the subcommand
+        max_path_words = max(max_path_words, depth + 1)
+        for info in registry.values():
+            subcommand_names.add(info.name)
+            subcommand_names.update(info.aliases)
+            arg_options[id(info)] = _static_arg_options(info)
+            options.update(_arg_option_words(info))
+            if info.subcommands:
+                queue.append((info.subcommands, depth + 1))
+    return max_path_words
 
 
 def init_command_sets():
     """Initialize command sets for syntax highlighting from the command registry."""
-    global _COMMANDS, _ALIASES, _SUBCOMMANDS, _OPTIONS
-    if _COMMANDS:
-        return  # Already initialized
+    global _COMMANDS, _ALIASES, _SUBCOMMANDS, _OPTIONS, _MAX_PATH_WORDS, _initialized
+    if _initialized:
+        return
+    # Registry traversals cached before initialization may be stale
+    _traverse_command_path.cache_clear()
+    _lex_line.cache_clear()
+    _command_trie.cache_clear()
+    _SUBCOMMAND_TRIES.clear()
+    commands: set[str] = set()
+    aliases: set[str] = set()
+    subcommand_names: set[str] = set()
+    options: set[str] = set()
+    arg_options: dict[int, tuple[tuple[str, str], ...]] = {}
+    # A command plus a trailing help/?
+    max_path_words = 2
     for info in get_command_registry().values():
-        _COMMANDS.add(info.name)
+        commands.add(info.name)
         for alias in info.aliases:
-            _ALIASES.add(alias)
-        # Collect options from command args (any arg type with choices)
-        for arg in info.args:
-            if arg.arg_type == "bool_toggle":
-                _OPTIONS.update(["on", "off"])
-            elif arg.choices:
-                _OPTIONS.update(c.lower() for c in arg.choices)
-        # Collect subcommands recursively
+            aliases.add(alias)
+        arg_options[id(info)] = _static_arg_options(info)
+        options.update(_arg_option_words(info))
+        # Collect nested subcommands
         if info.subcommands:
-            _collect_subcommands_and_options(info.subcommands)
+            path_words = _collect_subcommands_and_options(
+                info.subcommands, subcommand_names, options, arg_options
+            )
+            max_path_words = max(max_path_words, path_words)
+
+    _COMMANDS = frozenset(commands)
+    _ALIASES = frozenset(aliases)
+    _SUBCOMMANDS = frozenset(subcommand_names)
+    _OPTIONS = frozenset(options | _TOGGLE_WORDS)
+    _ARG_OPTIONS.update(arg_options)
+    _MAX_PATH_WORDS = max_path_words
+
+    # Commands take priority over aliases with the same name
+    _TOKEN_STYLE.update(dict.fromkeys(_ALIASES, "class:alias"))
+    _TOKEN_STYLE.update(dict.fromkeys(_COMMANDS, "class:command"))
+    _initialized = True
+
+
+def _subcommand_names(info) -> frozenset[str]:
+    """Get the words valid as the next subcommand after a CommandInfo.
+
+    Includes subcommand names and aliases, plus the help/? pseudo-subcommands
+    if the command has subcommands or args.
+    """
+    result = set()
+    if info.subcommands:
+        for sub_info in info.subcommands.values():
+            result.add(sub_info.name)
+            result.update(sub_info.aliases)
+    if info.subcommands or info.args:
+        result.add("help")
+        result.add("?")
+    return frozenset(result)
+
+
+@functools.lru_cache(maxsize=2048)
+def _traverse_command_path(words: tuple[str, ...], help_is_terminal: bool = False):
+    """Traverse the command hierarchy along already-lowercased words.
+
+    The registry doesn't change once commands are loaded, so results are
+    cached per word path and shared by the lexer and completer.
+
+    Args:
+        words: Lowercased words typed so far
+        help_is_terminal: If True, a help/? pseudo-subcommand (valid when the
+            command has subcommands or args) is counted in the depth and ends
+            the traversal
+
+    Returns:
+        Tuple of (info, depth, valid_subs) where:
+        - info: The CommandInfo at the current position, or None
+        - depth: How many words were consumed as commands/subcommands
+        - valid_subs: For each consumed word after the first, the set of
+          subcommand words that were valid at that position
+    """
+    if not words:
+        return None, 0, ()
+
+    registry = get_command_registry()
+    if words[0] not in registry:
+        return None, 0, ()
+
+    info = registry[words[0]]
+    depth = 1
+    valid_subs = []
+
+    # Traverse subcommand hierarchy
+    for i in range(1, len(words)):
+        word = words[i]
+        if help_is_terminal and word in ("help", "?") and (info.subcommands or info.args):
+            valid_subs.append(_subcommand_names(info))
+            depth = i + 1
+            break  # help is terminal, don't traverse further
+        if info.subcommands and word in info.subcommands:
+            # Count this as part of the command path (even if the subcommand
+            # has no handler, it's still a valid subcommand)
+            valid_subs.append(_subcommand_names(info))
+            info = info.subcommands[word]
+            depth = i + 1
+        else:
+            break
+
+    return info, depth, tuple(valid_subs)
+
+
+class _CompletionTrie:
+    """Prefix trie over (name, description) completion pairs.
+
+    Every node keeps the entries of its whole subtree in insertion order, so
+    a prefix lookup is a walk of len(prefix) steps with no filtering. Names
+    are matched case-insensitively. The trie is immutable once built, and
+    lookups return its shared entry tuples directly.
+    """
+
+    __slots__ = ("children", "entries")
+
+    def __init__(self):
+        self.children: dict[str, _CompletionTrie] = {}
+        # Filled as a list while building, then frozen to a tuple
+        self.entries: Sequence[tuple[str, str]] = []
+
+    @classmethod
+    def build(cls, entries: Iterable[tuple[str, str]]) -> "_CompletionTrie":
+        """Build a trie from (name, description) pairs."""
+        root = cls()
+        nodes = [root]
+        for entry in entries:
+            node = root
+            node.entries.append(entry)
+            for char in entry[0].lower():
+                child = node.children.get(char)
+                if child is None:
+                    child = node.children[char] = cls()
+                    nodes.append(child)
+                node = child
+                node.entries.append(entry)
+        for node in nodes:
+            node.entries = tuple(node.entries)
+        return root
+
+    def find(self, prefix: str) -> Sequence[tuple[str, str]]:
+        """Get all entries whose name starts with prefix (case-insensitive)."""
+        node = self
+        for char in prefix.lower():
+            node = node.children.get(char)
+            if node is None:
+                return ()
+        return node.entries
+
+
+@functools.lru_cache(maxsize=1)
+def _command_trie() -> _CompletionTrie:
+    """Get all unique command names with descriptions, sorted by name.
+
+    Cached since the registry doesn't change once commands are loaded.
+    """
+    # The registry maps each name and alias to the same CommandInfo, so
+    # dedupe by identity and emit each command's aliases once
+    seen_ids: set[int] = set()
+    commands = []
+    for info in get_command_registry().values():
+        if id(info) in seen_ids:
+            continue
+        seen_ids.add(id(info))
+        commands.append((info.name, info.description))
+        for alias in info.aliases:
+            commands.append((alias, f"Alias for {info.name}"))
+    return _CompletionTrie.build(sorted(commands))
+
+
+# Subcommand completions per CommandInfo, keyed by id() since CommandInfo
+# isn't hashable (registry entries live for the life of the process)
+_SUBCOMMAND_TRIES: dict[int, _CompletionTrie] = {}
+
+
+def _subcommand_trie(info) -> _CompletionTrie:
+    """Get the unique subcommands of a CommandInfo with descriptions, sorted by name."""
+    trie = _SUBCOMMAND_TRIES.get(id(info))
+    if trie is not None:
+        return trie
+
+    # Collect unique subcommands (aliases map to the same SubcommandInfo)
+    seen_ids: set[int] = set()
+    result = []
+    for sub_info in info.subcommands.values():
+        if id(sub_info) in seen_ids:
+            continue
+        seen_ids.add(id(sub_info))
+        result.append((sub_info.name, sub_info.description or ""))
+        # Also add aliases
+        for alias in sub_info.aliases:
+            result.append((alias, f"Alias for {sub_info.name}"))
+    trie = _SUBCOMMAND_TRIES[id(info)] = _CompletionTrie.build(sorted(result))
+    return trie
+
+
+@functools.lru_cache(maxsize=256)
+def _lex_line(line: str) -> tuple[tuple[str, str], ...]:
+    """Split a line into (style, text) tokens for syntax highlighting.
+
+    prompt_toolkit re-lexes on every repaint, and while typing the same
+    lines come up again and again, so results are cached per line text.
+    """
+    # Nothing to classify on an empty or whitespace-only line
+    if not line or line.isspace():
+        return (("", line),) if line else ()
+
+    tokens = []
+    # Only the first few words can be on the command path, so lowercase just
+    # those for the hierarchy lookup and stream the rest of the line
+    path_words = tuple(
+        m.group().lower()
+        for m in itertools.islice(_WORD_RE.finditer(line), _MAX_PATH_WORDS)
+    )
+    # Start of the pending run of unstyled text. Whitespace and plain words
+    # are emitted as one token when the next styled word (or the end of the
+    # line) is reached
+    plain_start = 0
+
+    # Get command context
+    info, cmd_depth, valid_subs = _traverse_command_path(path_words, help_is_terminal=True)
+
+    # Bind the per-word lookups locally for the loop
+    is_number = _NUMBER_RE.fullmatch
+    options = _OPTIONS
+
+    for i, match in enumerate(_WORD_RE.finditer(line)):
+        word = match.group()
+
+        # Determine token style
+        if i == 0:
+            # First word is command
+            style = _TOKEN_STYLE.get(path_words[0], "")
+        elif i < cmd_depth:
+            # This word is part of the command/subcommand path
+            style = "class:subcommand" if path_words[i] in valid_subs[i - 1] else ""
+        elif is_number(word):
+            # Arguments after command path
+            style = "class:number"
+        elif word.lower() in options:
+            style = "class:option"
+        else:
+            continue
+
+        if style:
+            start, end = match.span()
+            if start > plain_start:
+                tokens.append(("", line[plain_start:start]))
+            tokens.append((style, word))
+            plain_start = end
+
+    # Add remaining unstyled text
+    if plain_start < len(line):
+        tokens.append(("", line[plain_start:]))
+
+    return tuple(tokens)
+
 
+@functools.lru_cache(maxsize=None)
+def _completer_takes_prefix(completer: Callable) -> bool:
+    """Check whether an ArgSpec completer accepts the prefix being completed.
 
-def get_commands() -> set[str]:
+    Completers are fixed functions, so the signature is inspected only once
+    rather than on every tab press.
+    """
+    return len(inspect.signature(completer).parameters) > 0
+
+
+def get_commands() -> frozenset[str]:
     """Get the set of command names."""
     init_command_sets()
     return _COMMANDS
 
 
-def get_aliases() -> set[str]:
+def get_aliases() -> frozenset[str]:
     """Get the set of command aliases."""
     init_command_sets()
     return _ALIASES
@@ -122,205 +445,45 @@ if PROMPT_TOOLKIT_AVAILABLE:
     class SimulatorLexer(Lexer):
         """Syntax highlighter for simulator commands."""
 
-        def _get_current_command_info(self, words: list[str]):
-            """Traverse command hierarchy and return current command info.
-
-            Returns:
-                Tuple of (info, depth) where:
-                - info: The CommandInfo at the current position, or None
-                - depth: How many words were consumed as commands/subcommands
-            """
-            if not words:
-                return None, 0
-
-            registry = get_command_registry()
-            cmd = words[0].lower()
-            if cmd not in registry:
-                return None, 0
-
-            info = registry[cmd]
-            depth = 1
-
-            # Traverse subcommand hierarchy
-            for i in range(1, len(words)):
-                word = words[i].lower()
-                # Check for "help" pseudo-subcommand (valid if command has subcommands or args)
-                if word in ("help", "?") and (info.subcommands or info.args):
-                    depth = i + 1
-                    break  # help is terminal, don't traverse further
-                if info.subcommands and word in info.subcommands:
-                    # Count this as part of the command path for highlighting
-                    # (even if subcommand has no handler, it's still a valid subcommand)
-                    info = info.subcommands[word]
-                    depth = i + 1
-                else:
-                    break
-
-            return info, depth
-
-        def _get_valid_subcommands_at_depth(self, words: list[str], depth: int) -> set[str]:
-            """Get valid subcommand names at a specific depth in the command hierarchy."""
-            if depth == 0:
-                return set()
-
-            registry = get_command_registry()
-            cmd = words[0].lower()
-            if cmd not in registry:
-                return set()
-
-            info = registry[cmd]
-
-            # Traverse to the right depth
-            for i in range(1, depth):
-                if i >= len(words):
-                    break
-                word = words[i].lower()
-                if info.subcommands and word in info.subcommands:
-                    info = info.subcommands[word]
-                else:
-                    break
-
-            # Return subcommand names at this level
-            result = set()
-            if info.subcommands:
-                for sub_info in info.subcommands.values():
-                    result.add(sub_info.name)
-                    result.update(sub_info.aliases)
-            # Add help/? as pseudo-subcommands if command has subcommands or args
-            if info.subcommands or info.args:
-                result.add("help")
-                result.add("?")
-            return result
-
         def lex_document(self, document):
             """Return a lexer function for the document."""
-            # Initialize command sets if needed
-            init_command_sets()
+            # Document.lines is a property; resolve it once per document
+            lines = document.lines
 
             def get_line_tokens(line_number):
-                line = document.lines[line_number]
-                tokens = []
-                words = line.split()
-                pos = 0
-
-                # Get command context
-                info, cmd_depth = self._get_current_command_info(words)
-
-                for i, word in enumerate(words):
-                    # Find start position of this word
-                    start = line.find(word, pos)
-                    # Add any whitespace before
-                    if start > pos:
-                        tokens.append(("", line[pos:start]))
-
-                    # Determine token style
-                    if i == 0:
-                        # First word is command
-                        if word.lower() in _COMMANDS:
-                            tokens.append(("class:command", word))
-                        elif word.lower() in _ALIASES:
-                            tokens.append(("class:alias", word))
-                        else:
-                            tokens.append(("", word))
-                    elif i < cmd_depth:
-                        # This word is part of the command/subcommand path
-                        valid_subs = self._get_valid_subcommands_at_depth(words, i)
-                        if word.lower() in valid_subs:
-                            tokens.append(("class:subcommand", word))
-                        else:
-                            tokens.append(("", word))
-                    else:
-                        # Arguments after command path
-                        if (
-                            word.replace(".", "")
-                            .replace("-", "")
-                            .replace(":", "")
-                            .isdigit()
-                        ):
-                            tokens.append(("class:number", word))
-                        elif word.lower() in _OPTIONS:
-                            tokens.append(("class:option", word))
-                        else:
-                            tokens.append(("", word))
-
-                    pos = start + len(word)
-
-                # Add trailing whitespace
-                if pos < len(line):
-                    tokens.append(("", line[pos:]))
-
-                return tokens
+                return list(_lex_line(lines[line_number]))
 
             return get_line_tokens
 
     class SimulatorCompleter(Completer):
         """Tab completion for simulator commands."""
 
-        def _get_commands(self) -> list[tuple[str, str]]:
-            """Get all unique command names with descriptions."""
-            seen = set()
-            commands = []
-            for info in get_command_registry().values():
-                if info.name not in seen:
-                    seen.add(info.name)
-                    commands.append((info.name, info.description))
-                    for alias in info.aliases:
-                        if alias not in seen:
-                            seen.add(alias)
-                            commands.append((alias, f"Alias for {info.name}"))
-            return sorted(commands, key=lambda x: x[0])
-
-        def _traverse_to_current_info(self, words: list[str]):
+        def _traverse_to_current_info(self, words: tuple[str, ...]):
             """Traverse command hierarchy based on words already typed.
 
+            Args:
+                words: Lowercased words already typed
+
             Returns:
                 Tuple of (info, depth) where:
                 - info: The CommandInfo at the current position, or None
                 - depth: How many words were consumed as commands/subcommands
             """
-            if not words:
-                return None, 0
-
-            registry = get_command_registry()
-            cmd = words[0].lower()
-            if cmd not in registry:
-                return None, 0
-
-            info = registry[cmd]
-            depth = 1
-
-            # Traverse subcommand hierarchy
-            for i in range(1, len(words)):
-                word = words[i].lower()
-                if info.subcommands and word in info.subcommands:
-                    # Traverse into the subcommand
-                    info = info.subcommands[word]
-                    depth = i + 1
-                else:
-                    break
-
+            info, depth, _ = _traverse_command_path(words)
             return info, depth
 
-        def _get_subcommands_for_info(self, info) -> list[tuple[str, str]]:
-            """Get subcommands for a CommandInfo with descriptions."""
+        def _get_subcommands_for_info(self, info, prefix: str = "") -> Sequence[tuple[str, str]]:
+            """Get subcommands for a CommandInfo with descriptions.
+
+            Args:
+                info: The CommandInfo to get subcommands for
+                prefix: Only return subcommands starting with this (case-insensitive)
+            """
             if not info or not info.subcommands:
-                return []
+                return ()
+            return _subcommand_trie(info).find(prefix)
 
-            # Collect unique subcommands (avoid duplicates from aliases)
-            seen = set()
-            result = []
-            for sub_info in info.subcommands.values():
-                if sub_info.name not in seen:
-                    seen.add(sub_info.name)
-                    result.append((sub_info.name, sub_info.description or ""))
-                    # Also add aliases
-                    for alias in sub_info.aliases:
-                        if alias not in seen:
-                            seen.add(alias)
-                            result.append((alias, f"Alias for {sub_info.name}"))
-            return sorted(result, key=lambda x: x[0])
-
-        def _get_arg_options_for_info(self, info, prefix: str = "") -> list[tuple[str, str]]:
+        def _get_arg_options_for_info(self, info, prefix: str = "") -> Sequence[tuple[str, str]]:
             """Get argument options for a CommandInfo.
 
             Args:
@@ -330,22 +493,17 @@ if PROMPT_TOOLKIT_AVAILABLE:
             if not info or not info.args:
                 return []
 
-            # Check the first arg's type
-            arg = info.args[0]
-            if arg.arg_type == "bool_toggle":
-                return [("on", "Enable"), ("off", "Disable")]
-            elif arg.arg_type == "choice" and arg.choices:
-                return [(c.lower(), c) for c in arg.choices]
-            # Also check for choices on string args (like history's "clear")
-            elif arg.choices:
-                return [(c.lower(), c) for c in arg.choices]
+            # Fixed options (on/off, choices) are precomputed with the command sets
+            options = _ARG_OPTIONS.get(id(info))
+            if options:
+                return options
+
             # Check for dynamic completer
-            elif arg.completer:
+            arg = info.args[0]
+            if arg.completer:
                 try:
                     # Try calling with prefix first (for path-aware completers)
-                    import inspect
-                    sig = inspect.signature(arg.completer)
-                    if len(sig.parameters) > 0:
+                    if _completer_takes_prefix(arg.completer):
                         return arg.completer(prefix)
                     else:
                         return arg.completer()
@@ -379,42 +537,56 @@ if PROMPT_TOOLKIT_AVAILABLE:
 
             if not completed_words:
                 # Complete command names
-                for cmd, desc in self._get_commands():
-                    if cmd.startswith(word_before.lower()):
-                        yield Completion(
-                            cmd,
-                            start_position=-len(word_before),
-                            display_meta=desc,
-                        )
+                for cmd, desc in _command_trie().find(word_before):
+                    yield Completion(
+                        cmd,
+                        start_position=-len(word_before),
+                        display_meta=desc,
+                    )
             else:
                 # Traverse to current position in command hierarchy
-                info, depth = self._traverse_to_current_info(completed_words)
-
-                if info:
-                    # Collect all possible completions
-                    all_completions = []
-
-                    # Add subcommands
-                    all_completions.extend(self._get_subcommands_for_info(info))
-
-                    # Add argument options (on/off, choices, etc.)
-                    # Pass word_before as prefix for path-aware completers
-                    all_completions.extend(self._get_arg_options_for_info(info, word_before))
+                info, depth = self._traverse_to_current_info(
+                    tuple(w.lower() for w in completed_words)
+                )
 
-                    # Add help pseudo-subcommand
-                    all_completions.extend(self._get_help_completions(info))
+                # Unknown commands and leaf commands (no subcommands or args)
+                # have nothing further to complete
+                if info is None or not (info.subcommands or info.args):
+                    return
+
+                # Subcommands come pre-filtered from the prefix trie
+                all_completions = list(self._get_subcommands_for_info(info, word_before))
+
+                # Argument options (on/off, choices, etc.) and the help
+                # pseudo-subcommand are few, so filter them directly.
+                # Pass word_before as prefix for path-aware completers
+                prefix = word_before.lower()
+                for name, desc in itertools.chain(
+                    self._get_arg_options_for_info(info, word_before),
+                    self._get_help_completions(info),
+                ):
+                    if name.lower().startswith(prefix):
+                        all_completions.append((name, desc))
+
+                for name, desc in all_completions:
+                    yield Completion(
+                        name,
+                        start_position=-len(word_before),
+                        display_meta=desc,
+                    )
+
+    # Build the command sets once at import so the lexer and completer don't
+    # need an initialization check on every keystroke (the registry is fully
+    # populated by importing CommandHandler above)
+    init_command_sets()
 
-                    # Yield matching completions (case-insensitive)
-                    for name, desc in all_completions:
-                        if name.lower().startswith(word_before.lower()):
-                            yield Completion(
-                                name,
-                                start_position=-len(word_before),
-                                display_meta=desc,
-                            )
+    # The lexer and completer hold no per-session state, so every session
+    # shares one instance of each
+    _LEXER = SimulatorLexer()
+    _COMPLETER = SimulatorCompleter()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InputLine:
     """Processed input line from an interactive session."""
 
@@ -476,9 +648,9 @@ class InteractiveSession:
 
             self._session = PromptSession(
                 history=self._history.prompt_toolkit_history,
-                completer=SimulatorCompleter(),
+                completer=_COMPLETER,
                 complete_while_typing=False,
-                lexer=SimulatorLexer(),
+                lexer=_LEXER,
                 style=SIMULATOR_STYLE,
                 auto_suggest=AutoSuggestFromHistory(),
                 enable_history_search=True,
@@ -510,11 +682,12 @@ class InteractiveSession:
         if PROMPT_TOOLKIT_AVAILABLE and is_connected is not None:
             from prompt_toolkit.formatted_text import FormattedText
 
+            # The prompt is redrawn often, so build both variants once
+            connected_prompt = FormattedText([("class:prompt.connected", prompt_text)])
+            disconnected_prompt = FormattedText([("class:prompt.disconnected", prompt_text)])
+
             def get_prompt():
-                if is_connected():
-                    return FormattedText([("class:prompt.connected", prompt_text)])
-                else:
-                    return FormattedText([("class:prompt.disconnected", prompt_text)])
+                return connected_prompt if is_connected() else disconnected_prompt
 
         return cls(
             history_file=history_file,
@@ -562,10 +735,11 @@ class InteractiveSession:
             - If history recall succeeded: (resolved_line, True, None)
             - If history recall failed: (line, False, error_message)
         """
-        if not self._history or not line.startswith("!"):
+        history = self._history
+        if not history or not line or line[0] != "!":
             return line, False, None
 
-        result = self._history.resolve_recall(line)
+        result = history.resolve_recall(line)
         if result is None:
             return line, False, None
 
@@ -684,7 +858,12 @@ class InteractiveSession:
                     # Empty line or keyboard interrupt
                     continue
 
-                # Handle history recall (!!, !n, !-n)
+                # Most lines aren't history recalls (!!, !n, !-n), so pass
+                # them straight through without trying to resolve them
+                if line[0] != "!" or self._history is None:
+                    yield InputLine(original=line, resolved=line, was_history_recall=False)
+                    continue
+
                 resolved_line, was_history_recall, error = self.resolve_history_recall(line)
                 if error:
                     print(f">>> {error}")
@@ -129,6 +129,29 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    def encode_message(msg: dict) -> bytes:
+        """Encode a message as it is sent on the wire.
+
+        The client decodes the stream as ASCII, so messages orjson would
+        write as raw UTF-8 are escaped by json instead.
+        """
+        data = orjson.dumps(msg, option=orjson.OPT_NON_STR_KEYS)
+        if data.isascii():
+            return data
+        return json.dumps(msg).encode("ascii")
+else:
+    def encode_message(msg: dict) -> bytes:
+        """Encode a message as it is sent on the wire."""
+        return json.dumps(msg).encode("ascii")
+
+
 class CommandRegistry:
     """Registry for command handlers.
 
@@ -166,17 +189,24 @@ class DoorSimulatorProtocol(asyncio.Protocol):
         self,
         state: DoorSimulatorState,
         on_command: Optional[Callable[[str, dict], None]] = None,
-        broadcast_status: Optional[Callable[[], None]] = None,
+        server_broadcast: bool = False,
         on_disconnect: Optional[Callable[["DoorSimulatorProtocol"], None]] = None,
     ):
         self.state = state
         self.on_command = on_command
-        self.broadcast_status = broadcast_status
+        # True when a DoorSimulator broadcasts door status changes to all
+        # clients from the state's door status listeners
+        self.server_broadcast = server_broadcast
         self.on_disconnect = on_disconnect
         self.transport: Optional[asyncio.Transport] = None
         self.buffer = ""
+        # Unsolicited messages queued for a single coalesced write
+        self._pending: list[bytes] = []
+        self._flush_handle: Optional[asyncio.Handle] = None
+        # Position of the queued door status frame in _pending, if any
+        self._pending_status: Optional[int] = None
         self._door_task: Optional[asyncio.Task] = None
-        self._hold_remaining: float = 0
+        self._hold_deadline: float = 0
         self._last_sensor_trigger: float = 0
 
     def connection_made(self, transport: asyncio.Transport):
@@ -186,6 +216,11 @@ class DoorSimulatorProtocol(asyncio.Protocol):
 
     def connection_lost(self, exc):
         logger.info("Simulator: Client disconnected")
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending.clear()
+        self._pending_status = None
         if self._door_task:
             self._door_task.cancel()
         if self.on_disconnect:
@@ -194,7 +229,7 @@ class DoorSimulatorProtocol(asyncio.Protocol):
     def data_received(self, data: bytes):
         try:
             text = data.decode("ascii")
-            logger.debug(f"Simulator RX: {text}")
+            logger.debug("Simulator RX: %s", text)
             self.buffer += text
 
             # Parse complete JSON objects
@@ -231,9 +266,54 @@ class DoorSimulatorProtocol(asyncio.Protocol):
         return None
 
     def _send(self, msg: dict):
-        """Send a message to the client."""
-        data = json.dumps(msg).encode("ascii")
-        logger.debug(f"Simulator TX: {msg}")
+        """Send a message to the client.
+
+        Any queued messages are written first, in the same write, so the
+        client sees everything in the order it was sent.
+        """
+        logger.debug("Simulator TX: %s", msg)
+        self._send_raw(encode_message(msg))
+
+    def _send_raw(self, data: bytes):
+        """Send an already encoded message to the client."""
+        if self._pending:
+            self._pending.append(data)
+            self._flush()
+        elif self.transport:
+            self.transport.write(data)
+
+    def _queue(self, data: bytes):
+        """Queue an already encoded unsolicited message to the client.
+
+        Messages queued during the same event loop iteration (e.g. a burst
+        of broadcasts) are written to the transport together in one write.
+        """
+        self._pending.append(data)
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_soon(self._flush)
+
+    def _queue_status(self, data: bytes):
+        """Queue an encoded door status frame.
+
+        A status frame still waiting in the queue is superseded by the new
+        one, so transitions within the same event loop iteration only send
+        the latest status.
+        """
+        if self._pending_status is not None:
+            del self._pending[self._pending_status]
+        self._pending_status = len(self._pending)
+        self._queue(data)
+
+    def _flush(self):
+        """Write all queued messages to the transport."""
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+        data = b"".join(self._pending)
+        self._pending.clear()
+        self._pending_status = None
         if self.transport:
             self.transport.write(data)
 
@@ -654,7 +734,7 @@ class DoorSimulatorProtocol(asyncio.Protocol):
             skip_rising = False
 
         self.state.door_status = start_state
-        self._broadcast_or_send_status()
+        self._send_status_if_standalone()
 
         async def door_sequence():
             timing = self.state.timing
@@ -665,28 +745,38 @@ class DoorSimulatorProtocol(asyncio.Protocol):
 
                 # Door slows as it approaches the top (still opening)
                 self.state.door_status = DOOR_STATE_SLOWING
-                self._broadcast_or_send_status()
+                self._send_status_if_standalone()
 
             await asyncio.sleep(timing.slowing_time)
 
             if hold:
                 self.state.door_status = DOOR_STATE_KEEPUP
-                self._broadcast_or_send_status()
+                self._send_status_if_standalone()
                 # Hold indefinitely until explicit close
             else:
                 self.state.door_status = DOOR_STATE_HOLDING
-                self._broadcast_or_send_status()
-
-                # Hold for the configured time, checking for sensor blocking close
-                self._hold_remaining = float(self.state.hold_time)
-                while self._hold_remaining > 0 or self.state.is_sensor_blocking_close():
-                    # If sensor is blocking close, reset hold timer
+                self._send_status_if_standalone()
+
+                # Hold for the configured time, restarting it once a sensor
+                # that was blocking close clears. Sensor re-triggers push
+                # _hold_deadline out while we wait.
+                loop = asyncio.get_running_loop()
+                changed = self.state.hold_changed
+                self._hold_deadline = loop.time() + float(self.state.hold_time)
+                while True:
+                    changed.clear()
                     if self.state.is_sensor_blocking_close():
                         logger.debug("Simulator: Sensor blocking close, resetting hold timer")
-                        self._hold_remaining = float(self.state.hold_time)
-
-                    await asyncio.sleep(0.1)
-                    self._hold_remaining -= 0.1
+                        await changed.wait()
+                        self._hold_deadline = loop.time() + float(self.state.hold_time)
+                        continue
+                    remaining = self._hold_deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        await asyncio.wait_for(changed.wait(), remaining)
+                    except TimeoutError:
+                        pass
 
                 # Start closing
                 await self._do_close_sequence()
@@ -757,7 +847,7 @@ class DoorSimulatorProtocol(asyncio.Protocol):
         timing = self.state.timing
 
         self.state.door_status = start_state
-        self._broadcast_or_send_status()
+        self._send_status_if_standalone()
 
         async def close_sequence():
             if not skip_top:
@@ -775,7 +865,7 @@ class DoorSimulatorProtocol(asyncio.Protocol):
                     return
 
                 self.state.door_status = DOOR_STATE_CLOSING_MID_OPEN
-                self._broadcast_or_send_status()
+                self._send_status_if_standalone()
 
             await asyncio.sleep(timing.closing_mid_time)
 
@@ -790,7 +880,7 @@ class DoorSimulatorProtocol(asyncio.Protocol):
                 return
 
             self.state.door_status = DOOR_STATE_CLOSED
-            self._broadcast_or_send_status()
+            self._send_status_if_standalone()
             self.state.total_open_cycles += 1
 
         self._door_task = asyncio.create_task(close_sequence())
@@ -804,11 +894,13 @@ class DoorSimulatorProtocol(asyncio.Protocol):
             FIELD_DIRECTION: DOOR_TO_PHONE,
         })
 
-    def _broadcast_or_send_status(self):
-        """Broadcast door status to all clients, or send to this client only."""
-        if self.broadcast_status:
-            self.broadcast_status()
-        else:
+    def _send_status_if_standalone(self):
+        """Send door status to this client when no server broadcasts it.
+
+        With a server attached, its door status listener on the state
+        broadcasts every change to all clients.
+        """
+        if not self.server_broadcast:
             self._send_door_status()
 
     def _send_sensor_notification(self, sensor: str, state: str = "on"):
@@ -838,7 +930,7 @@ class DoorSimulatorProtocol(asyncio.Protocol):
             FIELD_SUCCESS: SUCCESS_TRUE,
             FIELD_DIRECTION: DOOR_TO_PHONE,
         })
-        logger.debug(f"Simulator: Sent {sensor} sensor {state} notification")
+        logger.debug("Simulator: Sent %s sensor %s notification", sensor, state)
 
     def trigger_sensor(self, sensor: str):
         """Simulate a sensor trigger (pet walking through).
@@ -848,38 +940,19 @@ class DoorSimulatorProtocol(asyncio.Protocol):
         """
         now = time.time()
 
-        # Check if sensor is enabled and power is on
-        if not self.state.power:
-            logger.info(f"Simulator: Sensor {sensor} ignored (power OFF)")
-            return
-
-        # Check command lockout
-        if self.state.cmd_lockout:
-            logger.info(f"Simulator: Sensor {sensor} ignored (command lockout)")
-            return
-
-        if sensor == "inside" and not self.state.inside:
-            logger.info("Simulator: Inside sensor ignored (disabled)")
-            return
-
-        if sensor == "outside":
-            if not self.state.outside:
-                logger.info("Simulator: Outside sensor ignored (disabled)")
-                return
-            if self.state.safety_lock:
-                logger.info("Simulator: Outside sensor ignored (safety lock)")
-                return
-
-        # Check schedule enforcement
-        if not self.state.is_sensor_allowed_by_schedule(sensor):
-            logger.info(f"Simulator: {sensor.capitalize()} sensor ignored (outside schedule)")
+        # Check power, lockout, sensor enable/safety lock and schedule
+        reason = self.state.sensor_trigger_blocked(sensor)
+        if reason:
+            logger.info("Simulator: %s", reason)
             return
 
         # If door is already open/holding, re-trigger extends hold time
         if self.state.door_status in (DOOR_STATE_HOLDING, DOOR_STATE_KEEPUP):
             if now - self._last_sensor_trigger > self.state.timing.sensor_retrigger_window:
                 logger.info(f"Simulator: {sensor.capitalize()} sensor re-triggered, extending hold")
-                self._hold_remaining = float(self.state.hold_time)
+                self._hold_deadline = (
+                    asyncio.get_running_loop().time() + float(self.state.hold_time)
+                )
                 self._last_sensor_trigger = now
                 self._send_sensor_notification(sensor, "on")
             return
@@ -44,6 +44,7 @@ Available actions:
 """
 
 import asyncio
+import functools
 import logging
 import time
 from dataclasses import dataclass, field
@@ -508,8 +509,13 @@ class ScriptRunner:
 SCRIPTS_DIR = Path(__file__).parent / "scripts"
 
 
+@functools.lru_cache(maxsize=1)
 def _get_script_files() -> dict[str, Path]:
-    """Get all available script files from the scripts directory."""
+    """Get all available script files from the scripts directory.
+
+    The scripts directory ships with the package, so it is scanned once.
+    The returned dict is shared and must not be modified.
+    """
     scripts = {}
     if SCRIPTS_DIR.exists():
         for path in SCRIPTS_DIR.glob("*.yaml"):
@@ -547,6 +553,25 @@ def list_builtin_scripts() -> list[tuple[str, str]]:
     return result
 
 
+@functools.lru_cache(maxsize=1)
+def _builtin_script_completions() -> tuple[tuple[str, str], ...]:
+    """Return (name, description) for each built-in script.
+
+    Built-in scripts ship with the package and never change at runtime,
+    so they are loaded once rather than re-parsed on every tab press.
+    """
+    result = []
+    for name, path in sorted(_get_script_files().items()):
+        description = "(builtin)"
+        if YAML_AVAILABLE:
+            try:
+                description = Script.from_file(path).description or description
+            except Exception:
+                pass
+        result.append((name, description))
+    return tuple(result)
+
+
 def script_completer(prefix: str = "") -> list[tuple[str, str]]:
     """Return list of (script_name, description) for tab completion.
 
@@ -610,18 +635,7 @@ def script_completer(prefix: str = "") -> list[tuple[str, str]]:
         # No specific directory - show builtin scripts and cwd files
 
         # Add builtin scripts
-        script_files = _get_script_files()
-        if script_files:
-            if YAML_AVAILABLE:
-                for name, path in sorted(script_files.items()):
-                    try:
-                        script = Script.from_file(path)
-                        result.append((name, script.description or "(builtin)"))
-                    except Exception:
-                        result.append((name, "(builtin)"))
-            else:
-                for name in sorted(script_files.keys()):
-                    result.append((name, "(builtin)"))
+        result.extend(_builtin_script_completions())
 
         # Add YAML files from current directory
         cwd = Path.cwd()
@@ -47,6 +47,7 @@ from ..const import (
     CMD_DELETE_SCHEDULE,
     CMD_GET_SETTINGS,
     NOTIFY_LOW_BATTERY,
+    DOOR_STATUS,
     DOOR_TO_PHONE,
     FIELD_AUTO,
     FIELD_AUTORETRACT,
@@ -56,6 +57,7 @@ from ..const import (
     FIELD_CMD,
     FIELD_CMD_LOCKOUT,
     FIELD_DIRECTION,
+    FIELD_DOOR_STATUS,
     FIELD_FWINFO,
     FIELD_HOLD_TIME,
     FIELD_INSIDE,
@@ -81,10 +83,35 @@ from ..const import (
 
 from ..tz_utils import get_posix_tz_string, is_cache_initialized
 from .state import DoorSimulatorState, Schedule, BatteryConfig
-from .protocol import DoorSimulatorProtocol
+from .protocol import DoorSimulatorProtocol, encode_message
 
 logger = logging.getLogger(__name__)
 
+
+def _encode_unsolicited(msg: dict) -> bytes:
+    """Add the fields every door-initiated message carries, then encode."""
+    msg[FIELD_SUCCESS] = SUCCESS_TRUE
+    msg[FIELD_DIRECTION] = DOOR_TO_PHONE
+    return encode_message(msg)
+
+
+# On/off setting broadcasts: name -> (command when enabled, command when
+# disabled, field, whether the field is nested under FIELD_SETTINGS)
+_TOGGLE_BROADCASTS = {
+    "power": (CMD_POWER_ON, CMD_POWER_OFF, FIELD_POWER, False),
+    "auto": (CMD_ENABLE_AUTO, CMD_DISABLE_AUTO, FIELD_AUTO, False),
+    "inside_sensor": (CMD_ENABLE_INSIDE, CMD_DISABLE_INSIDE, FIELD_INSIDE, False),
+    "outside_sensor": (CMD_ENABLE_OUTSIDE, CMD_DISABLE_OUTSIDE, FIELD_OUTSIDE, False),
+    "safety_lock": (
+        CMD_ENABLE_OUTSIDE_SENSOR_SAFETY_LOCK,
+        CMD_DISABLE_OUTSIDE_SENSOR_SAFETY_LOCK,
+        FIELD_OUTSIDE_SENSOR_SAFETY_LOCK,
+        True,
+    ),
+    "cmd_lockout": (CMD_ENABLE_CMD_LOCKOUT, CMD_DISABLE_CMD_LOCKOUT, FIELD_CMD_LOCKOUT, True),
+    "autoretract": (CMD_ENABLE_AUTORETRACT, CMD_DISABLE_AUTORETRACT, FIELD_AUTORETRACT, True),
+}
+
 # Low battery threshold for notifications
 LOW_BATTERY_THRESHOLD = 20
 
@@ -122,7 +149,17 @@ class DoorSimulator:
         self.state = state or DoorSimulatorState()
         self.server: Optional[asyncio.Server] = None
         self.protocols: list[DoorSimulatorProtocol] = []
+        self._door_status_frames: dict[str, bytes] = {}
+        self._toggle_frames: dict[tuple[str, bool], bytes] = {}
         self._battery_task: Optional[asyncio.Task] = None
+        # Door sequences started without a client (sensor trigger/activation)
+        self._door_tasks: set[asyncio.Task] = set()
+        # Pending sensor auto-deactivations, by sensor name
+        self._deactivate_handles: dict[str, asyncio.TimerHandle] = {}
+        # Fractional battery percent not yet applied by the battery loop
+        self._battery_carry = 0.0
+        # Battery status broadcast deferred to the end of the loop iteration
+        self._battery_broadcast_handle: Optional[asyncio.Handle] = None
         self._running = False
         self._on_connect = on_connect
         self._on_disconnect = on_disconnect
@@ -132,15 +169,18 @@ class DoorSimulator:
         loop = asyncio.get_running_loop()
 
         def handle_disconnect(protocol):
-            if protocol in self.protocols:
+            try:
                 self.protocols.remove(protocol)
-                if self._on_disconnect:
-                    self._on_disconnect()
+            except ValueError:
+                # Already dropped (e.g. by stop())
+                return
+            if self._on_disconnect:
+                self._on_disconnect()
 
         def protocol_factory():
             protocol = DoorSimulatorProtocol(
                 self.state,
-                broadcast_status=self._broadcast_door_status,
+                server_broadcast=True,
                 on_disconnect=handle_disconnect,
             )
             self.protocols.append(protocol)
@@ -155,14 +195,23 @@ class DoorSimulator:
         )
 
         self._running = True
+        # Door status changes are broadcast as they happen
+        if self._broadcast_door_status not in self.state.door_status_listeners:
+            self.state.door_status_listeners.append(self._broadcast_door_status)
         self._battery_task = asyncio.create_task(self._battery_simulation_loop())
 
-        logger.info(f"Door simulator listening on {self.host}:{self.port}")
+        logger.info("Door simulator listening on %s:%s", self.host, self.port)
 
     async def stop(self):
         """Stop the simulator server."""
         self._running = False
 
+        # The state may be owned by the caller and outlive this simulator
+        try:
+            self.state.door_status_listeners.remove(self._broadcast_door_status)
+        except ValueError:
+            pass
+
         if self._battery_task:
             self._battery_task.cancel()
             try:
@@ -171,8 +220,24 @@ class DoorSimulator:
                 pass
             self._battery_task = None
 
-        # Close all client connections and cancel their tasks
-        for protocol in self.protocols:
+        for handle in self._deactivate_handles.values():
+            handle.cancel()
+        self._deactivate_handles.clear()
+
+        if self._battery_broadcast_handle:
+            self._battery_broadcast_handle.cancel()
+            self._battery_broadcast_handle = None
+
+        door_tasks = tuple(self._door_tasks)
+        for task in door_tasks:
+            task.cancel()
+        if door_tasks:
+            await asyncio.gather(*door_tasks, return_exceptions=True)
+        self._door_tasks.clear()
+
+        # Close all client connections and cancel their tasks. Iterate over a
+        # snapshot, as disconnect callbacks can remove entries while we await.
+        for protocol in tuple(self.protocols):
             if protocol._door_task:
                 protocol._door_task.cancel()
                 try:
@@ -180,6 +245,8 @@ class DoorSimulator:
                 except asyncio.CancelledError:
                     pass
             if protocol.transport:
+                # Deliver anything still queued before closing
+                protocol._flush()
                 protocol.transport.close()
         self.protocols.clear()
 
@@ -193,136 +260,189 @@ class DoorSimulator:
     # =========================================================================
 
     async def _battery_simulation_loop(self):
-        """Background task that simulates battery charge/discharge over time."""
+        """Background task that simulates battery charge/discharge over time.
+
+        Ticks are scheduled against absolute deadlines so sleep overshoot
+        does not accumulate, and each step is applied for the time that
+        actually elapsed since the previous one.
+        """
+        loop = asyncio.get_running_loop()
+        last = deadline = loop.time()
         while self._running:
+            config = self.state.battery_config
+            deadline += config.update_interval
             try:
-                config = self.state.battery_config
-                await asyncio.sleep(config.update_interval)
-
-                if not self._running:
-                    break
+                await asyncio.sleep(deadline - loop.time())
+            except asyncio.CancelledError:
+                break
 
-                # Only simulate if battery is present
-                if not self.state.battery_present:
-                    continue
+            if not self._running:
+                break
 
-                old_percent = self.state.battery_percent
-
-                if self.state.ac_present and config.charge_rate > 0:
-                    # Charging: increase battery level
-                    # Rate is per minute, interval is in seconds
-                    delta = config.charge_rate * (config.update_interval / 60.0)
-                    new_percent = min(100, self.state.battery_percent + delta)
-                    if new_percent != self.state.battery_percent:
-                        self.state.battery_percent = int(new_percent)
-                        logger.debug(
-                            f"Battery charging: {old_percent}% -> {self.state.battery_percent}%"
-                        )
-                        self._broadcast_battery_status()
-
-                elif not self.state.ac_present and config.discharge_rate > 0:
-                    # Discharging: decrease battery level
-                    delta = config.discharge_rate * (config.update_interval / 60.0)
-                    new_percent = max(0, self.state.battery_percent - delta)
-                    if int(new_percent) != self.state.battery_percent:
-                        self.state.battery_percent = int(new_percent)
-                        logger.debug(
-                            f"Battery discharging: {old_percent}% -> {self.state.battery_percent}%"
-                        )
-                        self._broadcast_battery_status()
-
-                        # Check for low battery notification
-                        if (
-                            old_percent > LOW_BATTERY_THRESHOLD
-                            and self.state.battery_percent <= LOW_BATTERY_THRESHOLD
-                        ):
-                            self._send_low_battery_notification()
+            now = loop.time()
+            elapsed, last = now - last, now
+            if now - deadline > config.update_interval:
+                # Fell more than a tick behind (e.g. interval changed or
+                # the loop was blocked); restart the schedule from now
+                deadline = now
 
-            except asyncio.CancelledError:
-                break
+            try:
+                self._simulate_battery_step(config, elapsed)
             except Exception as e:
-                logger.error(f"Error in battery simulation: {e}")
+                logger.error("Error in battery simulation: %s", e)
+
+    def _simulate_battery_step(self, config: BatteryConfig, elapsed: Optional[float] = None):
+        """Apply battery charge/discharge for elapsed seconds.
+
+        elapsed defaults to one update_interval.
+        """
+        if elapsed is None:
+            elapsed = config.update_interval
+        state = self.state
+
+        # Only simulate if battery is present
+        if not state.battery_present:
+            return
+
+        if state.ac_present:
+            rate = config.charge_rate
+        else:
+            rate = -config.discharge_rate
+        if rate == 0:
+            return
+
+        # Rate is per minute, elapsed is in seconds. Carry sub-percent
+        # changes between ticks so slow rates still add up correctly
+        # (rounded so e.g. ten 0.1% ticks make a whole percent).
+        self._battery_carry += rate * (elapsed / 60.0)
+        step = int(round(self._battery_carry, 6))
+        if not step:
+            return
+        self._battery_carry -= step
+
+        old_percent = state.battery_percent
+        new_percent = min(100, max(0, old_percent + step))
+        if new_percent == old_percent:
+            # Already full or empty
+            self._battery_carry = 0.0
+            return
+
+        state.battery_percent = new_percent
+        logger.debug(
+            "Battery %s: %s%% -> %s%%",
+            "charging" if step > 0 else "discharging", old_percent, new_percent,
+        )
+        self._schedule_battery_broadcast()
+
+        # Check for low battery notification
+        if old_percent > LOW_BATTERY_THRESHOLD >= new_percent:
+            self._send_low_battery_notification()
+
+    def _broadcast(self, msg: dict):
+        """Queue an unsolicited message for every connected client.
+
+        Each client's queue is flushed once per event loop iteration, so a
+        burst of broadcasts (e.g. broadcast_all) reaches each client as a
+        single write. The message is encoded once and shared by all clients.
+        The success and direction fields are added here.
+        """
+        if not self.protocols:
+            return
+        logger.debug("Simulator TX (broadcast): %s", msg)
+        self._broadcast_raw(_encode_unsolicited(msg))
+
+    def _broadcast_raw(self, frame: bytes):
+        """Queue an already encoded message for every connected client."""
+        for protocol in self.protocols:
+            protocol._queue(frame)
+
+    def _broadcast_toggle(self, name: str, enabled: bool):
+        """Broadcast an on/off setting change from _TOGGLE_BROADCASTS.
+
+        There are only two messages per setting, so each is encoded once.
+        """
+        if not self.protocols:
+            return
+        key = (name, enabled)
+        frame = self._toggle_frames.get(key)
+        if frame is None:
+            cmd_on, cmd_off, field, in_settings = _TOGGLE_BROADCASTS[name]
+            value = {field: "1" if enabled else "0"}
+            msg = {FIELD_CMD: cmd_on if enabled else cmd_off}
+            if in_settings:
+                msg[FIELD_SETTINGS] = value
+            else:
+                msg.update(value)
+            frame = self._toggle_frames[key] = _encode_unsolicited(msg)
+        logger.debug("Simulator TX (broadcast): %s %s", name, "on" if enabled else "off")
+        self._broadcast_raw(frame)
+
+    def _schedule_battery_broadcast(self):
+        """Broadcast battery status once the current loop iteration is done.
+
+        Several battery changes in a row then go out as a single frame.
+        """
+        if not self.protocols or self._battery_broadcast_handle is not None:
+            return
+        self._battery_broadcast_handle = asyncio.get_running_loop().call_soon(
+            self._broadcast_battery_status
+        )
 
     def _broadcast_battery_status(self):
         """Broadcast battery status to all connected clients."""
+        if self._battery_broadcast_handle is not None:
+            self._battery_broadcast_handle.cancel()
+            self._battery_broadcast_handle = None
+        if not self.protocols:
+            return
         # Report 0% if battery is not present
         percent = self.state.battery_percent if self.state.battery_present else 0
-        for protocol in self.protocols:
-            protocol._send({
-                "CMD": CMD_GET_DOOR_BATTERY,
-                FIELD_BATTERY_PERCENT: percent,
-                FIELD_BATTERY_PRESENT: "1" if self.state.battery_present else "0",
-                FIELD_AC_PRESENT: "1" if self.state.ac_present else "0",
-                FIELD_SUCCESS: SUCCESS_TRUE,
-                FIELD_DIRECTION: DOOR_TO_PHONE,
-            })
+        self._broadcast({
+            "CMD": CMD_GET_DOOR_BATTERY,
+            FIELD_BATTERY_PERCENT: percent,
+            FIELD_BATTERY_PRESENT: "1" if self.state.battery_present else "0",
+            FIELD_AC_PRESENT: "1" if self.state.ac_present else "0",
+        })
 
     def _send_low_battery_notification(self):
         """Send low battery notification to connected clients."""
         if self.state.low_battery:
-            for protocol in self.protocols:
-                protocol._send({
-                    "CMD": NOTIFY_LOW_BATTERY,
-                    FIELD_BATTERY_PERCENT: self.state.battery_percent,
-                    FIELD_SUCCESS: SUCCESS_TRUE,
-                    FIELD_DIRECTION: DOOR_TO_PHONE,
-                })
-            logger.info(f"Simulator: Low battery notification ({self.state.battery_percent}%)")
+            # Keep the notification behind the status update that caused it
+            if self._battery_broadcast_handle is not None:
+                self._broadcast_battery_status()
+            self._broadcast({
+                "CMD": NOTIFY_LOW_BATTERY,
+                FIELD_BATTERY_PERCENT: self.state.battery_percent,
+            })
+            logger.info("Simulator: Low battery notification (%s%%)", self.state.battery_percent)
 
     def broadcast_settings(self):
         """Broadcast settings to all connected clients."""
-        for protocol in self.protocols:
-            protocol._send({
-                FIELD_CMD: CMD_GET_SETTINGS,
-                FIELD_SETTINGS: self.state.get_settings(),
-                FIELD_SUCCESS: SUCCESS_TRUE,
-                FIELD_DIRECTION: DOOR_TO_PHONE,
-            })
+        self._broadcast({
+            FIELD_CMD: CMD_GET_SETTINGS,
+            FIELD_SETTINGS: self.state.get_settings(),
+        })
 
     def broadcast_safety_lock(self, enabled: bool):
         """Broadcast safety lock setting change to all connected clients."""
-        cmd = CMD_ENABLE_OUTSIDE_SENSOR_SAFETY_LOCK if enabled else CMD_DISABLE_OUTSIDE_SENSOR_SAFETY_LOCK
-        for protocol in self.protocols:
-            protocol._send({
-                FIELD_CMD: cmd,
-                FIELD_SETTINGS: {FIELD_OUTSIDE_SENSOR_SAFETY_LOCK: "1" if enabled else "0"},
-                FIELD_SUCCESS: SUCCESS_TRUE,
-                FIELD_DIRECTION: DOOR_TO_PHONE,
-            })
+        self._broadcast_toggle("safety_lock", enabled)
 
     def broadcast_cmd_lockout(self, enabled: bool):
         """Broadcast command lockout setting change to all connected clients."""
-        cmd = CMD_ENABLE_CMD_LOCKOUT if enabled else CMD_DISABLE_CMD_LOCKOUT
-        for protocol in self.protocols:
-            protocol._send({
-                FIELD_CMD: cmd,
-                FIELD_SETTINGS: {FIELD_CMD_LOCKOUT: "1" if enabled else "0"},
-                FIELD_SUCCESS: SUCCESS_TRUE,
-                FIELD_DIRECTION: DOOR_TO_PHONE,
-            })
+        self._broadcast_toggle("cmd_lockout", enabled)
 
     def broadcast_autoretract(self, enabled: bool):
         """Broadcast autoretract setting change to all connected clients."""
-        cmd = CMD_ENABLE_AUTORETRACT if enabled else CMD_DISABLE_AUTORETRACT
-        for protocol in self.protocols:
-            protocol._send({
-                FIELD_CMD: cmd,
-                FIELD_SETTINGS: {FIELD_AUTORETRACT: "1" if enabled else "0"},
-                FIELD_SUCCESS: SUCCESS_TRUE,
-                FIELD_DIRECTION: DOOR_TO_PHONE,
-            })
+        self._broadcast_toggle("autoretract", enabled)
 
     def broadcast_hold_time(self):
         """Broadcast hold time setting change to all connected clients."""
         # Convert seconds to centiseconds for protocol
         hold_time_cs = int(self.state.hold_time * 100)
-        for protocol in self.protocols:
-            protocol._send({
-                FIELD_CMD: CMD_SET_HOLD_TIME,
-                FIELD_HOLD_TIME: hold_time_cs,
-                FIELD_SUCCESS: SUCCESS_TRUE,
-                FIELD_DIRECTION: DOOR_TO_PHONE,
-            })
+        self._broadcast({
+            FIELD_CMD: CMD_SET_HOLD_TIME,
+            FIELD_HOLD_TIME: hold_time_cs,
+        })
 
     def broadcast_timezone(self):
         """Broadcast timezone setting change to all connected clients."""
@@ -332,134 +452,82 @@ class DoorSimulator:
             posix_tz = get_posix_tz_string(self.state.timezone)
             if posix_tz:
                 tz_value = posix_tz
-        for protocol in self.protocols:
-            protocol._send({
-                FIELD_CMD: CMD_SET_TIMEZONE,
-                FIELD_TZ: tz_value,
-                FIELD_SUCCESS: SUCCESS_TRUE,
-                FIELD_DIRECTION: DOOR_TO_PHONE,
-            })
+        self._broadcast({
+            FIELD_CMD: CMD_SET_TIMEZONE,
+            FIELD_TZ: tz_value,
+        })
 
     def broadcast_notification_settings(self):
         """Broadcast notification settings change to all connected clients."""
-        for protocol in self.protocols:
-            protocol._send({
-                FIELD_CMD: CMD_SET_NOTIFICATIONS,
-                FIELD_NOTIFICATIONS: self.state.get_notifications(),
-                FIELD_SUCCESS: SUCCESS_TRUE,
-                FIELD_DIRECTION: DOOR_TO_PHONE,
-            })
+        self._broadcast({
+            FIELD_CMD: CMD_SET_NOTIFICATIONS,
+            FIELD_NOTIFICATIONS: self.state.get_notifications(),
+        })
 
     def broadcast_power(self, enabled: bool):
         """Broadcast power setting change to all connected clients."""
-        cmd = CMD_POWER_ON if enabled else CMD_POWER_OFF
-        for protocol in self.protocols:
-            protocol._send({
-                FIELD_CMD: cmd,
-                FIELD_POWER: "1" if enabled else "0",
-                FIELD_SUCCESS: SUCCESS_TRUE,
-                FIELD_DIRECTION: DOOR_TO_PHONE,
-            })
+        self._broadcast_toggle("power", enabled)
 
     def broadcast_auto(self, enabled: bool):
         """Broadcast auto/timers setting change to all connected clients."""
-        cmd = CMD_ENABLE_AUTO if enabled else CMD_DISABLE_AUTO
-        for protocol in self.protocols:
-            protocol._send({
-                FIELD_CMD: cmd,
-                FIELD_AUTO: "1" if enabled else "0",
-                FIELD_SUCCESS: SUCCESS_TRUE,
-                FIELD_DIRECTION: DOOR_TO_PHONE,
-            })
+        self._broadcast_toggle("auto", enabled)
 
     def broadcast_inside_sensor(self, enabled: bool):
         """Broadcast inside sensor enable/disable to all connected clients."""
-        cmd = CMD_ENABLE_INSIDE if enabled else CMD_DISABLE_INSIDE
-        for protocol in self.protocols:
-            protocol._send({
-                FIELD_CMD: cmd,
-                FIELD_INSIDE: "1" if enabled else "0",
-                FIELD_SUCCESS: SUCCESS_TRUE,
-                FIELD_DIRECTION: DOOR_TO_PHONE,
-            })
+        self._broadcast_toggle("inside_sensor", enabled)
 
     def broadcast_outside_sensor(self, enabled: bool):
         """Broadcast outside sensor enable/disable to all connected clients."""
-        cmd = CMD_ENABLE_OUTSIDE if enabled else CMD_DISABLE_OUTSIDE
-        for protocol in self.protocols:
-            protocol._send({
-                FIELD_CMD: cmd,
-                FIELD_OUTSIDE: "1" if enabled else "0",
-                FIELD_SUCCESS: SUCCESS_TRUE,
-                FIELD_DIRECTION: DOOR_TO_PHONE,
-            })
+        self._broadcast_toggle("outside_sensor", enabled)
 
     def broadcast_hardware_info(self):
         """Broadcast hardware/firmware info to all connected clients."""
-        for protocol in self.protocols:
-            protocol._send({
-                "CMD": CMD_GET_HW_INFO,
-                FIELD_FWINFO: {
-                    FIELD_FW_MAJOR: self.state.fw_major,
-                    FIELD_FW_MINOR: self.state.fw_minor,
-                    FIELD_FW_PATCH: self.state.fw_patch,
-                    FIELD_HW_VERSION: self.state.hw_ver,
-                    FIELD_HW_REVISION: self.state.hw_rev,
-                },
-                FIELD_SUCCESS: SUCCESS_TRUE,
-                FIELD_DIRECTION: DOOR_TO_PHONE,
-            })
+        self._broadcast({
+            "CMD": CMD_GET_HW_INFO,
+            FIELD_FWINFO: {
+                FIELD_FW_MAJOR: self.state.fw_major,
+                FIELD_FW_MINOR: self.state.fw_minor,
+                FIELD_FW_PATCH: self.state.fw_patch,
+                FIELD_HW_VERSION: self.state.hw_ver,
+                FIELD_HW_REVISION: self.state.hw_rev,
+            },
+        })
 
     def broadcast_stats(self):
         """Broadcast door open statistics to all connected clients."""
-        for protocol in self.protocols:
-            protocol._send({
-                "CMD": CMD_GET_DOOR_OPEN_STATS,
-                FIELD_TOTAL_OPEN_CYCLES: self.state.total_open_cycles,
-                FIELD_TOTAL_AUTO_RETRACTS: self.state.total_auto_retracts,
-                FIELD_SUCCESS: SUCCESS_TRUE,
-                FIELD_DIRECTION: DOOR_TO_PHONE,
-            })
+        self._broadcast({
+            "CMD": CMD_GET_DOOR_OPEN_STATS,
+            FIELD_TOTAL_OPEN_CYCLES: self.state.total_open_cycles,
+            FIELD_TOTAL_AUTO_RETRACTS: self.state.total_auto_retracts,
+        })
 
     def broadcast_schedules(self):
         """Broadcast schedule list to all connected clients."""
-        for protocol in self.protocols:
-            protocol._send({
-                "CMD": CMD_GET_SCHEDULE_LIST,
-                FIELD_SCHEDULES: self.state.get_schedule_list(),
-                FIELD_SUCCESS: SUCCESS_TRUE,
-                FIELD_DIRECTION: DOOR_TO_PHONE,
-            })
+        self._broadcast({
+            "CMD": CMD_GET_SCHEDULE_LIST,
+            FIELD_SCHEDULES: self.state.get_schedule_list(),
+        })
 
     def broadcast_schedule(self, schedule: Schedule):
         """Broadcast a single schedule add/update to all connected clients."""
-        for protocol in self.protocols:
-            protocol._send({
-                "CMD": CMD_SET_SCHEDULE,
-                FIELD_SCHEDULE: schedule.to_dict(),
-                FIELD_SUCCESS: SUCCESS_TRUE,
-                FIELD_DIRECTION: DOOR_TO_PHONE,
-            })
+        self._broadcast({
+            "CMD": CMD_SET_SCHEDULE,
+            FIELD_SCHEDULE: schedule.to_dict(),
+        })
 
     def broadcast_schedule_delete(self, index: int):
         """Broadcast a schedule deletion to all connected clients."""
-        for protocol in self.protocols:
-            protocol._send({
-                "CMD": CMD_DELETE_SCHEDULE,
-                FIELD_INDEX: index,
-                FIELD_SUCCESS: SUCCESS_TRUE,
-                FIELD_DIRECTION: DOOR_TO_PHONE,
-            })
+        self._broadcast({
+            "CMD": CMD_DELETE_SCHEDULE,
+            FIELD_INDEX: index,
+        })
 
     def broadcast_notifications(self):
         """Broadcast notification settings to all connected clients."""
-        for protocol in self.protocols:
-            protocol._send({
-                "CMD": CMD_GET_NOTIFICATIONS,
-                FIELD_NOTIFICATIONS: self.state.get_notifications(),
-                FIELD_SUCCESS: SUCCESS_TRUE,
-                FIELD_DIRECTION: DOOR_TO_PHONE,
-            })
+        self._broadcast({
+            "CMD": CMD_GET_NOTIFICATIONS,
+            FIELD_NOTIFICATIONS: self.state.get_notifications(),
+        })
 
     def broadcast_all(self):
         """Broadcast all state information to all connected clients."""
@@ -485,7 +553,7 @@ class DoorSimulator:
         """
         if self.protocols:
             # If clients connected, use the first protocol's trigger_sensor.
-            # Status updates will be broadcast to all clients via broadcast_status callback.
+            # Status updates will be broadcast to all clients by the door status listener.
             self.protocols[0].trigger_sensor(sensor)
         else:
             # No clients connected - directly simulate the sensor trigger
@@ -496,36 +564,21 @@ class DoorSimulator:
 
         This is used when running scripts without a client connection.
         """
-        # Check if sensor is enabled and power is on
-        if not self.state.power:
-            logger.info(f"Simulator: Sensor {sensor} ignored (power OFF)")
-            return
-
-        # Check command lockout
-        if self.state.cmd_lockout:
-            logger.info(f"Simulator: Sensor {sensor} ignored (command lockout)")
-            return
-
-        if sensor == "inside" and not self.state.inside:
-            logger.info("Simulator: Inside sensor ignored (disabled)")
-            return
-
-        if sensor == "outside":
-            if not self.state.outside:
-                logger.info("Simulator: Outside sensor ignored (disabled)")
-                return
-            if self.state.safety_lock:
-                logger.info("Simulator: Outside sensor ignored (safety lock)")
-                return
-
-        # Check schedule enforcement
-        if not self.state.is_sensor_allowed_by_schedule(sensor):
-            logger.info(f"Simulator: {sensor.capitalize()} sensor ignored (outside schedule)")
+        # Check power, lockout, sensor enable/safety lock and schedule
+        reason = self.state.sensor_trigger_blocked(sensor)
+        if reason:
+            logger.info("Simulator: %s", reason)
             return
 
         # Door is closed, trigger open
-        logger.info(f"Simulator: {sensor.capitalize()} sensor triggered, opening door")
-        asyncio.create_task(self._direct_open_door(hold=False))
+        logger.info("Simulator: %s sensor triggered, opening door", sensor.capitalize())
+        self._start_door_sequence(self._direct_open_door(hold=False))
+
+    def _start_door_sequence(self, coro):
+        """Run a direct door sequence as a task that stop() will cancel."""
+        task = asyncio.create_task(coro)
+        self._door_tasks.add(task)
+        task.add_done_callback(self._door_tasks.discard)
 
     async def _direct_open_door(self, hold: bool = False):
         """Open door directly without a client connection.
@@ -563,34 +616,39 @@ class DoorSimulator:
             skip_rising = False
 
         self.state.door_status = start_state
-        self._broadcast_door_status()
 
         if not skip_rising:
             await asyncio.sleep(timing.rise_time)
 
             # Door slows as it approaches the top (still opening)
             self.state.door_status = DOOR_STATE_SLOWING
-            self._broadcast_door_status()
 
         await asyncio.sleep(timing.slowing_time)
 
         if hold:
             self.state.door_status = DOOR_STATE_KEEPUP
-            self._broadcast_door_status()
         else:
             self.state.door_status = DOOR_STATE_HOLDING
-            self._broadcast_door_status()
 
-            # Hold for configured time, checking for sensor blocking close
-            hold_remaining = float(self.state.hold_time)
-            while hold_remaining > 0 or self.state.is_sensor_blocking_close():
-                # If sensor is blocking close, reset hold timer
+            # Hold for configured time, restarting it once a sensor that
+            # was blocking close clears
+            loop = asyncio.get_running_loop()
+            changed = self.state.hold_changed
+            deadline = loop.time() + float(self.state.hold_time)
+            while True:
+                changed.clear()
                 if self.state.is_sensor_blocking_close():
                     logger.debug("Simulator: Sensor blocking close, resetting hold timer")
-                    hold_remaining = float(self.state.hold_time)
-
-                await asyncio.sleep(0.1)
-                hold_remaining -= 0.1
+                    await changed.wait()
+                    deadline = loop.time() + float(self.state.hold_time)
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    await asyncio.wait_for(changed.wait(), remaining)
+                except TimeoutError:
+                    pass
 
             # Close
             await self._direct_close_door()
@@ -637,7 +695,6 @@ class DoorSimulator:
                 logger.info("Simulator: Reversing open at slowing, closing from top")
 
         self.state.door_status = start_state
-        self._broadcast_door_status()
 
         if not skip_top:
             await asyncio.sleep(timing.closing_top_time)
@@ -647,7 +704,6 @@ class DoorSimulator:
                 return
 
             self.state.door_status = DOOR_STATE_CLOSING_MID_OPEN
-            self._broadcast_door_status()
 
         await asyncio.sleep(timing.closing_mid_time)
 
@@ -656,7 +712,6 @@ class DoorSimulator:
             return
 
         self.state.door_status = DOOR_STATE_CLOSED
-        self._broadcast_door_status()
         self.state.total_open_cycles += 1
 
     async def _check_sensor_retract(self) -> bool:
@@ -676,8 +731,19 @@ class DoorSimulator:
 
     def _broadcast_door_status(self):
         """Broadcast door status to all connected clients."""
+        if not self.protocols:
+            return
+        # Only a handful of door states exist, so encode each one once
+        status = self.state.door_status
+        frame = self._door_status_frames.get(status)
+        if frame is None:
+            frame = self._door_status_frames[status] = _encode_unsolicited({
+                FIELD_CMD: DOOR_STATUS,
+                FIELD_DOOR_STATUS: status,
+            })
+        logger.debug("Simulator TX (broadcast): door status %s", status)
         for protocol in self.protocols:
-            protocol._send_door_status()
+            protocol._queue_status(frame)
 
     def simulate_obstruction(self):
         """Simulate obstruction detection (inside sensor active indefinitely).
@@ -705,7 +771,7 @@ class DoorSimulator:
             ):
                 logger.info("Simulator: Obstruction during close (will trigger retract)")
             else:
-                logger.info(f"Simulator: Obstruction set (door status: {self.state.door_status})")
+                logger.info("Simulator: Obstruction set (door status: %s)", self.state.door_status)
 
     def activate_sensor(self, sensor: str, duration: float = 0.5):
         """Activate sensor detection with optional duration.
@@ -726,26 +792,26 @@ class DoorSimulator:
                 # Toggle mode
                 self.state.inside_sensor_active = not self.state.inside_sensor_active
                 logger.info(
-                    f"Simulator: Inside sensor {'activated' if self.state.inside_sensor_active else 'deactivated'} (toggle)"
+                    "Simulator: Inside sensor %s (toggle)",
+                    "activated" if self.state.inside_sensor_active else "deactivated",
                 )
             else:
                 self.state.inside_sensor_active = True
-                logger.info(f"Simulator: Inside sensor activated for {duration}s")
-                # Schedule deactivation
-                asyncio.create_task(self._deactivate_sensor_after("inside", duration))
+                logger.info("Simulator: Inside sensor activated for %ss", duration)
+                self._schedule_deactivate("inside", duration)
         elif sensor == "outside":
             self.state.inside_sensor_active = False
             if duration == 0:
                 # Toggle mode
                 self.state.outside_sensor_active = not self.state.outside_sensor_active
                 logger.info(
-                    f"Simulator: Outside sensor {'activated' if self.state.outside_sensor_active else 'deactivated'} (toggle)"
+                    "Simulator: Outside sensor %s (toggle)",
+                    "activated" if self.state.outside_sensor_active else "deactivated",
                 )
             else:
                 self.state.outside_sensor_active = True
-                logger.info(f"Simulator: Outside sensor activated for {duration}s")
-                # Schedule deactivation
-                asyncio.create_task(self._deactivate_sensor_after("outside", duration))
+                logger.info("Simulator: Outside sensor activated for %ss", duration)
+                self._schedule_deactivate("outside", duration)
 
         # If door is closed and sensor should trigger, open the door
         if self.state.door_status == DOOR_STATE_CLOSED:
@@ -760,12 +826,25 @@ class DoorSimulator:
                     should_trigger = True
 
             if should_trigger:
-                logger.info(f"Simulator: {sensor.capitalize()} sensor triggering door cycle")
-                asyncio.create_task(self._direct_open_door(hold=False))
+                logger.info("Simulator: %s sensor triggering door cycle", sensor.capitalize())
+                self._start_door_sequence(self._direct_open_door(hold=False))
+
+    def _schedule_deactivate(self, sensor: str, duration: float):
+        """Deactivate sensor after specified duration.
 
-    async def _deactivate_sensor_after(self, sensor: str, duration: float):
-        """Deactivate sensor after specified duration."""
-        await asyncio.sleep(duration)
+        Replaces any deactivation already pending for the sensor, so a new
+        activation is not cut short by an earlier, shorter one.
+        """
+        handle = self._deactivate_handles.get(sensor)
+        if handle:
+            handle.cancel()
+        self._deactivate_handles[sensor] = asyncio.get_running_loop().call_later(
+            duration, self._deactivate_sensor, sensor
+        )
+
+    def _deactivate_sensor(self, sensor: str):
+        """Deactivate a sensor whose activation duration has expired."""
+        self._deactivate_handles.pop(sensor, None)
         if sensor == "inside" and self.state.inside_sensor_active:
             self.state.inside_sensor_active = False
             logger.info("Simulator: Inside sensor deactivated (duration expired)")
@@ -783,7 +862,7 @@ class DoorSimulator:
             self.state.outside_sensor_active = False
         else:
             self.state.inside_sensor_active = False
-        logger.info(f"Simulator: Pet {'in' if present else 'left'} doorway")
+        logger.info("Simulator: Pet %s doorway", "in" if present else "left")
 
     # =========================================================================
     # Door Control
@@ -821,13 +900,18 @@ class DoorSimulator:
         Sends a low battery notification if battery drops below 20%
         and low battery notifications are enabled.
         """
+        # An explicit level supersedes any partial percent still carried
+        self._battery_carry = 0.0
         old_percent = self.state.battery_percent
-        self.state.battery_percent = max(0, min(100, percent))
+        new_percent = max(0, min(100, percent))
+        if new_percent == old_percent:
+            return
 
-        self._broadcast_battery_status()
+        self.state.battery_percent = new_percent
+        self._schedule_battery_broadcast()
 
         # Send low battery notification if crossing threshold
-        if old_percent > LOW_BATTERY_THRESHOLD and percent <= LOW_BATTERY_THRESHOLD:
+        if old_percent > LOW_BATTERY_THRESHOLD >= new_percent:
             self._send_low_battery_notification()
 
     def set_ac_present(self, present: bool):
@@ -840,8 +924,10 @@ class DoorSimulator:
             return
 
         self.state.ac_present = present
-        logger.info(f"Simulator: AC {'connected' if present else 'disconnected'}")
-        self._broadcast_battery_status()
+        # A partial discharge must not be paid back by charging (or vice versa)
+        self._battery_carry = 0.0
+        logger.info("Simulator: AC %s", "connected" if present else "disconnected")
+        self._schedule_battery_broadcast()
 
     def set_battery_present(self, present: bool):
         """Set battery presence state and notify clients.
@@ -853,8 +939,8 @@ class DoorSimulator:
             return
 
         self.state.battery_present = present
-        logger.info(f"Simulator: Battery {'installed' if present else 'removed'}")
-        self._broadcast_battery_status()
+        logger.info("Simulator: Battery %s", "installed" if present else "removed")
+        self._schedule_battery_broadcast()
 
     def set_charge_rate(self, rate: float):
         """Set battery charge rate (percent per minute).
@@ -863,7 +949,7 @@ class DoorSimulator:
             rate: Charge rate in percent per minute. Set to 0 to disable charging.
         """
         self.state.battery_config.charge_rate = max(0.0, rate)
-        logger.info(f"Simulator: Charge rate set to {rate}%/min")
+        logger.info("Simulator: Charge rate set to %s%%/min", rate)
 
     def set_discharge_rate(self, rate: float):
         """Set battery discharge rate (percent per minute).
@@ -872,12 +958,12 @@ class DoorSimulator:
             rate: Discharge rate in percent per minute. Set to 0 to disable discharging.
         """
         self.state.battery_config.discharge_rate = max(0.0, rate)
-        logger.info(f"Simulator: Discharge rate set to {rate}%/min")
+        logger.info("Simulator: Discharge rate set to %s%%/min", rate)
 
     def set_power(self, enabled: bool):
         """Set power state."""
         self.state.power = enabled
-        logger.info(f"Simulator: Power {'ON' if enabled else 'OFF'}")
+        logger.info("Simulator: Power %s", "ON" if enabled else "OFF")
 
     # =========================================================================
     # Schedule Management
@@ -886,12 +972,12 @@ class DoorSimulator:
     def add_schedule(self, schedule: Schedule):
         """Add or update a schedule."""
         self.state.schedules[schedule.index] = schedule
-        logger.info(f"Simulator: Added schedule {schedule.index}")
+        logger.info("Simulator: Added schedule %s", schedule.index)
         self.broadcast_schedule(schedule)
 
     def remove_schedule(self, index: int):
         """Remove a schedule by index."""
         if index in self.state.schedules:
             del self.state.schedules[index]
-            logger.info(f"Simulator: Removed schedule {index}")
+            logger.info("Simulator: Removed schedule %s", index)
             self.broadcast_schedule_delete(index)
@@ -8,8 +8,12 @@
 This module contains all the state-related dataclasses used by the simulator.
 """
 
+import asyncio
+import functools
+import zoneinfo
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Callable, Optional
 
 from ..tz_utils import get_posix_tz_string, is_cache_initialized
 from ..const import (
@@ -45,8 +49,55 @@ from ..const import (
 # 1. Settings fields for sensor enable/disable (string "0"/"1")
 # 2. Schedule entry fields for which sensor the entry applies to (bool)
 
-
-@dataclass
+# Schedule fields that make up its time window
+_SCHEDULE_TIME_FIELDS = frozenset({"start_hour", "start_min", "end_hour", "end_min"})
+
+
+@functools.lru_cache(maxsize=8)
+def _get_zoneinfo(name: str) -> zoneinfo.ZoneInfo:
+    """Get the ZoneInfo for a timezone name, falling back to UTC if invalid."""
+    try:
+        return zoneinfo.ZoneInfo(name)
+    except Exception:
+        return zoneinfo.ZoneInfo("UTC")
+
+
+# State fields that feed is_sensor_blocking_close(). Setting any of them
+# wakes door sequences waiting out their hold time.
+_HOLD_FIELDS = frozenset({
+    "inside",
+    "outside",
+    "safety_lock",
+    "cmd_lockout",
+    "inside_sensor_active",
+    "outside_sensor_active",
+})
+
+# State fields reported by get_settings() and get_notifications(). Setting
+# any of them drops the corresponding cached dict.
+_SETTINGS_FIELDS = frozenset({
+    "power",
+    "inside",
+    "outside",
+    "auto",
+    "safety_lock",
+    "cmd_lockout",
+    "autoretract",
+    "timezone",
+    "hold_time",
+    "sensor_trigger_voltage",
+    "sleep_sensor_trigger_voltage",
+})
+_NOTIFICATION_FIELDS = frozenset({
+    "sensor_on_indoor",
+    "sensor_off_indoor",
+    "sensor_on_outdoor",
+    "sensor_off_outdoor",
+    "low_battery",
+})
+
+
+@dataclass(slots=True)
 class DoorTimingConfig:
     """Configurable timing for door operations (all times in seconds)."""
 
@@ -65,7 +116,7 @@ class DoorTimingConfig:
     sensor_retrigger_window: float = 0.5
 
 
-@dataclass
+@dataclass(slots=True)
 class BatteryConfig:
     """Configuration for battery charge/discharge simulation.
 
@@ -111,6 +162,23 @@ class Schedule:
     end_hour: int = 22
     end_min: int = 0
 
+    # (start, end) of the time window in minutes since midnight, computed on
+    # first use and dropped when a time field changes
+    _window: Optional[tuple[int, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # days_of_week as a bitmask (bit 0 = Sunday), rebuilt when it is reassigned
+    _days_mask: Optional[int] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in _SCHEDULE_TIME_FIELDS:
+            super().__setattr__("_window", None)
+        elif name == "days_of_week":
+            super().__setattr__("_days_mask", None)
+
     def to_dict(self) -> dict:
         """Convert to protocol dict format."""
         result = {
@@ -207,7 +275,14 @@ class Schedule:
             return False
         # Convert Python weekday (Mon=0...Sun=6) to protocol format (Sun=0, Mon=1, ..., Sat=6)
         day_index = (weekday + 1) % 7
-        return bool(self.days_of_week[day_index])
+        mask = self._days_mask
+        if mask is None:
+            mask = 0
+            for i, active in enumerate(self.days_of_week[:7]):
+                if active:
+                    mask |= 1 << i
+            self._days_mask = mask
+        return bool((mask >> day_index) & 1)
 
     def is_sensor_allowed(self, sensor: str, hour: int, minute: int, weekday: int) -> bool:
         """Check if a sensor trigger is allowed at the given time.
@@ -230,9 +305,14 @@ class Schedule:
         if not self.is_day_active(weekday):
             return False
 
+        window = self._window
+        if window is None:
+            window = self._window = (
+                self.start_hour * 60 + self.start_min,
+                self.end_hour * 60 + self.end_min,
+            )
+        start, end = window
         current_minutes = hour * 60 + minute
-        start = self.start_hour * 60 + self.start_min
-        end = self.end_hour * 60 + self.end_min
 
         # Handle schedules that cross midnight
         if start <= end:
@@ -305,6 +385,65 @@ class DoorSimulatorState:
     inside_sensor_active: bool = False
     outside_sensor_active: bool = False
 
+    # Backing event for hold_changed and the event loop it was made for
+    _hold_changed: Optional[asyncio.Event] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _hold_changed_loop: Optional[asyncio.AbstractEventLoop] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # Called with no arguments whenever door_status changes value
+    door_status_listeners: list[Callable[[], None]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    # Cached get_settings() (keyed by timezone cache state) and
+    # get_notifications() results
+    _settings_cache: Optional[tuple[bool, dict]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _notifications_cache: Optional[dict] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name, value):
+        if name == "door_status":
+            changed = self.__dict__.get(name) != value
+            super().__setattr__(name, value)
+            if changed:
+                # May be unset while __init__ is still assigning fields
+                for listener in self.__dict__.get("door_status_listeners", ()):
+                    listener()
+            return
+        super().__setattr__(name, value)
+        if name in _SETTINGS_FIELDS:
+            super().__setattr__("_settings_cache", None)
+        elif name in _NOTIFICATION_FIELDS:
+            super().__setattr__("_notifications_cache", None)
+        if name in _HOLD_FIELDS:
+            # May be unset while __init__ is still assigning fields
+            event = self.__dict__.get("_hold_changed")
+            if event is not None:
+                event.set()
+
+    @property
+    def hold_changed(self) -> asyncio.Event:
+        """Event set whenever a field affecting is_sensor_blocking_close() changes.
+
+        An asyncio.Event is bound to the loop that first waits on it, so a
+        new one is made when the state is used from a different event loop.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        event = self._hold_changed
+        if event is None or (loop is not None and loop is not self._hold_changed_loop):
+            event = self._hold_changed = asyncio.Event()
+            self._hold_changed_loop = loop
+        return event
+
     @property
     def sensor_active(self) -> bool:
         """Check if any sensor is currently detecting something."""
@@ -332,15 +471,24 @@ class DoorSimulatorState:
         return False
 
     def get_settings(self) -> dict:
-        """Get full settings dict."""
+        """Get full settings dict.
+
+        The dict is cached until a settings field changes and is shared
+        between callers, so it must not be modified.
+        """
+        tz_initialized = is_cache_initialized()
+        cached = self._settings_cache
+        if cached is not None and cached[0] == tz_initialized:
+            return cached[1]
+
         # Convert IANA timezone to POSIX format if cache is initialized
         tz_value = self.timezone
-        if is_cache_initialized():
+        if tz_initialized:
             posix_tz = get_posix_tz_string(self.timezone)
             if posix_tz:
                 tz_value = posix_tz
 
-        return {
+        settings = {
             FIELD_POWER: "1" if self.power else "0",
             FIELD_INSIDE: "1" if self.inside else "0",
             FIELD_OUTSIDE: "1" if self.outside else "0",
@@ -353,21 +501,57 @@ class DoorSimulatorState:
             FIELD_SENSOR_TRIGGER_VOLTAGE: self.sensor_trigger_voltage,
             FIELD_SLEEP_SENSOR_TRIGGER_VOLTAGE: self.sleep_sensor_trigger_voltage,
         }
+        self._settings_cache = (tz_initialized, settings)
+        return settings
 
     def get_notifications(self) -> dict:
-        """Get notifications settings."""
-        return {
+        """Get notifications settings.
+
+        The dict is cached until a notification field changes and is shared
+        between callers, so it must not be modified.
+        """
+        if self._notifications_cache is not None:
+            return self._notifications_cache
+
+        self._notifications_cache = {
             FIELD_SENSOR_ON_INDOOR_NOTIFICATIONS: "1" if self.sensor_on_indoor else "0",
             FIELD_SENSOR_OFF_INDOOR_NOTIFICATIONS: "1" if self.sensor_off_indoor else "0",
             FIELD_SENSOR_ON_OUTDOOR_NOTIFICATIONS: "1" if self.sensor_on_outdoor else "0",
             FIELD_SENSOR_OFF_OUTDOOR_NOTIFICATIONS: "1" if self.sensor_off_outdoor else "0",
             FIELD_LOW_BATTERY_NOTIFICATIONS: "1" if self.low_battery else "0",
         }
+        return self._notifications_cache
 
     def get_schedule_list(self) -> list[int]:
         """Get list of schedule indices (matches real device behavior)."""
         return list(self.schedules.keys())
 
+    def sensor_trigger_blocked(self, sensor: str) -> Optional[str]:
+        """Check whether a trigger of the given sensor should be ignored.
+
+        Args:
+            sensor: "inside" or "outside"
+
+        Returns:
+            A description of why the trigger is ignored, or None if the
+            sensor may open the door.
+        """
+        if not self.power:
+            return f"Sensor {sensor} ignored (power OFF)"
+        if self.cmd_lockout:
+            return f"Sensor {sensor} ignored (command lockout)"
+        if sensor == "inside":
+            if not self.inside:
+                return "Inside sensor ignored (disabled)"
+        elif sensor == "outside":
+            if not self.outside:
+                return "Outside sensor ignored (disabled)"
+            if self.safety_lock:
+                return "Outside sensor ignored (safety lock)"
+        if not self.is_sensor_allowed_by_schedule(sensor):
+            return f"{sensor.capitalize()} sensor ignored (outside schedule)"
+        return None
+
     def is_sensor_allowed_by_schedule(self, sensor: str) -> bool:
         """Check if a sensor trigger is allowed based on schedules.
 
@@ -389,18 +573,11 @@ class DoorSimulatorState:
             return True
 
         # Check if any schedule allows this sensor at the current time
-        try:
-            import zoneinfo
-            tz = zoneinfo.ZoneInfo(self.timezone)
-        except Exception:
-            # Fallback to UTC if timezone is invalid
-            import zoneinfo
-            tz = zoneinfo.ZoneInfo("UTC")
-
-        now = datetime.now(tz)
+        now = datetime.now(_get_zoneinfo(self.timezone))
+        hour, minute, weekday = now.hour, now.minute, now.weekday()
 
         for schedule in self.schedules.values():
-            if schedule.is_sensor_allowed(sensor, now.hour, now.minute, now.weekday()):
+            if schedule.is_sensor_allowed(sensor, hour, minute, weekday):
                 return True
 
         return False
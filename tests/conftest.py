@@ -31,12 +31,18 @@ class MockTransport:
 
     def __init__(self):
         self.written_data: list[bytes] = []
+        # JSON messages parsed from written_data as it is written
+        self._messages: list[dict] = []
         self._closing = False
         self._closed = False
 
     def write(self, data: bytes) -> None:
         """Record written data."""
         self.written_data.append(data)
+        try:
+            self._messages.append(json.loads(data.decode('ascii')))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            pass
 
     def is_closing(self) -> bool:
         """Return whether transport is closing."""
@@ -47,23 +53,17 @@ class MockTransport:
         self._closing = True
 
     def get_written_messages(self) -> list[dict]:
-        """Parse and return all written JSON messages."""
-        messages = []
-        for data in self.written_data:
-            try:
-                messages.append(json.loads(data.decode('ascii')))
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                pass
-        return messages
+        """Return all written JSON messages."""
+        return list(self._messages)
 
     def get_last_message(self) -> dict | None:
         """Get the last written JSON message."""
-        messages = self.get_written_messages()
-        return messages[-1] if messages else None
+        return self._messages[-1] if self._messages else None
 
     def clear(self) -> None:
         """Clear recorded data."""
         self.written_data.clear()
+        self._messages.clear()
 
 
 class MockDeviceProtocol:
@@ -162,23 +162,25 @@ MOCK_SCHEDULE_ENTRY = {
 }
 
 
+# Response bodies by command, without the CMD field
+_MOCK_RESPONSES = {
+    "DOOR_STATUS": MOCK_DOOR_STATUS,
+    "GET_SETTINGS": MOCK_SETTINGS,
+    "GET_SENSORS": MOCK_SENSORS,
+    "DOOR_BATTERY": MOCK_DOOR_BATTERY,
+    "GET_HW_INFO": MOCK_HARDWARE,
+    "GET_SCHEDULE_LIST": {"schedules": MOCK_SCHEDULE_LIST},
+    "GET_SCHEDULE": MOCK_SCHEDULE_ENTRY,
+}
+
+
 def create_mock_response(cmd: str, msg_id: int, **extra) -> dict:
     """Factory function to create mock device responses."""
-    responses = {
-        "DOOR_STATUS": {**MOCK_DOOR_STATUS, "CMD": "DOOR_STATUS"},
-        "GET_SETTINGS": {**MOCK_SETTINGS, "CMD": "GET_SETTINGS"},
-        "GET_SENSORS": {**MOCK_SENSORS, "CMD": "GET_SENSORS"},
-        "DOOR_BATTERY": {**MOCK_DOOR_BATTERY, "CMD": "DOOR_BATTERY"},
-        "GET_HW_INFO": {**MOCK_HARDWARE, "CMD": "GET_HW_INFO"},
-        "GET_SCHEDULE_LIST": {"schedules": MOCK_SCHEDULE_LIST, "CMD": "GET_SCHEDULE_LIST"},
-        "GET_SCHEDULE": {**MOCK_SCHEDULE_ENTRY, "CMD": "GET_SCHEDULE"},
-    }
-
-    base_response = responses.get(cmd, {"CMD": cmd})
     return {
         FIELD_SUCCESS: "true",
         "msgId": msg_id,
-        **base_response,
+        **_MOCK_RESPONSES.get(cmd, {}),
+        "CMD": cmd,
         **extra
     }
 
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import re
 from typing import Any
 
 import pytest
@@ -24,10 +25,15 @@ from powerpetdoor.const import FIELD_DOOR_STATUS
 class MessageCapture:
     """Helper to capture messages from the simulator."""
 
+    _decoder = json.JSONDecoder()
+    _whitespace = re.compile(r"\s*")
+
     def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
         self.reader = reader
         self.writer = writer
         self.messages: list[dict[str, Any]] = []
+        # Trailing text of a message not yet fully received
+        self._buffer = ""
         self._listen_task: asyncio.Task | None = None
 
     async def start_listening(self):
@@ -41,7 +47,7 @@ class MessageCapture:
                 data = await self.reader.read(4096)
                 if not data:
                     break
-                self.messages.extend(self._parse_messages(data.decode("ascii")))
+                self.messages.extend(self._parse_messages(data))
         except asyncio.CancelledError:
             pass
 
@@ -55,30 +61,25 @@ class MessageCapture:
                 pass
         return self.messages
 
-    def _parse_messages(self, data: str) -> list[dict[str, Any]]:
-        """Parse multiple JSON objects from a string."""
+    def _parse_messages(self, data: bytes) -> list[dict[str, Any]]:
+        """Parse the JSON objects completed by a chunk of received data.
+
+        The simulator sends JSON objects back to back, so a chunk may end
+        partway through one; the remainder is kept until the next chunk.
+        """
+        buf = self._buffer + data.decode("ascii")
         messages = []
         pos = 0
-        while pos < len(data):
-            if data[pos] != '{':
-                pos += 1
-                continue
-            depth = 0
-            end = pos
-            for i, c in enumerate(data[pos:], pos):
-                if c == '{':
-                    depth += 1
-                elif c == '}':
-                    depth -= 1
-                    if depth == 0:
-                        end = i + 1
-                        break
-            if end > pos:
-                try:
-                    messages.append(json.loads(data[pos:end]))
-                except json.JSONDecodeError:
-                    pass
-            pos = end if end > pos else pos + 1
+        while True:
+            pos = self._whitespace.match(buf, pos).end()
+            if pos == len(buf):
+                break
+            try:
+                msg, pos = self._decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                break
+            messages.append(msg)
+        self._buffer = buf[pos:]
         return messages
 
     def find_status_updates(self) -> list[dict[str, Any]]:
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import re
 from typing import Any
 
 import pytest
@@ -64,10 +65,15 @@ async def simulator(timing_config):
 class MessageCapture:
     """Helper to capture messages from the simulator."""
 
+    _decoder = json.JSONDecoder()
+    _whitespace = re.compile(r"\s*")
+
     def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
         self.reader = reader
         self.writer = writer
         self.messages: list[dict[str, Any]] = []
+        # Trailing text of a message not yet fully received
+        self._buffer = ""
 
     async def send(self, msg: dict[str, Any]) -> None:
         """Send a message to the simulator."""
@@ -84,7 +90,7 @@ class MessageCapture:
                 timeout=timeout
             )
             if data:
-                messages.extend(self._parse_messages(data.decode("ascii")))
+                messages.extend(self._parse_messages(data))
         except asyncio.TimeoutError:
             pass
         self.messages.extend(messages)
@@ -107,7 +113,7 @@ class MessageCapture:
                     timeout=poll_interval
                 )
                 if data:
-                    new_msgs = self._parse_messages(data.decode("ascii"))
+                    new_msgs = self._parse_messages(data)
                     messages.extend(new_msgs)
                     self.messages.extend(new_msgs)
                     for msg in new_msgs:
@@ -118,30 +124,25 @@ class MessageCapture:
 
         return messages
 
-    def _parse_messages(self, data: str) -> list[dict[str, Any]]:
-        """Parse multiple JSON objects from a string."""
+    def _parse_messages(self, data: bytes) -> list[dict[str, Any]]:
+        """Parse the JSON objects completed by a chunk of received data.
+
+        The simulator sends JSON objects back to back, so a chunk may end
+        partway through one; the remainder is kept until the next chunk.
+        """
+        buf = self._buffer + data.decode("ascii")
         messages = []
         pos = 0
-        while pos < len(data):
-            if data[pos] != '{':
-                pos += 1
-                continue
-            depth = 0
-            end = pos
-            for i, c in enumerate(data[pos:], pos):
-                if c == '{':
-                    depth += 1
-                elif c == '}':
-                    depth -= 1
-                    if depth == 0:
-                        end = i + 1
-                        break
-            if end > pos:
-                try:
-                    messages.append(json.loads(data[pos:end]))
-                except json.JSONDecodeError:
-                    pass
-            pos = end if end > pos else pos + 1
+        while True:
+            pos = self._whitespace.match(buf, pos).end()
+            if pos == len(buf):
+                break
+            try:
+                msg, pos = self._decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                break
+            messages.append(msg)
+        self._buffer = buf[pos:]
         return messages
 
     def find_message(self, cmd: str) -> dict[str, Any] | None:
@@ -0,0 +1,200 @@
+# Copyright (c) 2025 Preston Elder
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Tests for the shared prompt components (prompt_common.py)."""
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("prompt_toolkit")
+
+from prompt_toolkit.document import Document
+
+from powerpetdoor.simulator.prompt_common import (
+    InteractiveSession,
+    SimulatorCompleter,
+    SimulatorLexer,
+)
+
+
+def lex(line: str) -> list[tuple[str, str]]:
+    """Lex a single line, merging adjacent unstyled tokens."""
+    tokens = SimulatorLexer().lex_document(Document(line))(0)
+    merged: list[tuple[str, str]] = []
+    for style, text in tokens:
+        if merged and style == "" and merged[-1][0] == "":
+            merged[-1] = ("", merged[-1][1] + text)
+        else:
+            merged.append((style, text))
+    return merged
+
+
+def complete(text: str) -> list[str]:
+    """Get completion texts for the given input."""
+    document = Document(text, len(text))
+    return [c.text for c in SimulatorCompleter().get_completions(document, None)]
+
+
+# ============================================================================
+# Lexer Tests
+# ============================================================================
+
+class TestSimulatorLexer:
+    """Tests for SimulatorLexer token classification."""
+
+    def test_empty_line(self):
+        """Empty line produces no text."""
+        assert "".join(text for _, text in lex("")) == ""
+
+    def test_whitespace_only_line(self):
+        """Whitespace-only lines are a single unstyled token."""
+        assert lex("   ") == [("", "   ")]
+
+    def test_tokens_reconstruct_line(self):
+        """Tokens cover the line exactly, including whitespace."""
+        line = "  schedule   add inside  6:00-22:00 weekdays  "
+        assert "".join(text for _, text in lex(line)) == line
+
+    def test_tabs_and_mixed_whitespace(self):
+        """Any whitespace separates words and is kept verbatim."""
+        line = "schedule\tadd \t inside\t6:00-22:00"
+        tokens = lex(line)
+        assert "".join(text for _, text in tokens) == line
+        assert ("class:subcommand", "add") in tokens
+        assert ("class:number", "6:00-22:00") in tokens
+
+    def test_command_and_alias(self):
+        """First word is styled as a command or alias."""
+        assert lex("status")[0] == ("class:command", "status")
+        assert lex("s")[0] == ("class:alias", "s")
+        assert lex("bogus")[0] == ("", "bogus")
+
+    def test_command_is_case_insensitive(self):
+        """Command matching ignores case but keeps the typed text."""
+        assert lex("STATUS")[0] == ("class:command", "STATUS")
+
+    def test_subcommand(self):
+        """Words on the command path are styled as subcommands."""
+        tokens = lex("schedule add")
+        assert ("class:subcommand", "add") in tokens
+
+    def test_numbers(self):
+        """Numeric arguments, times and ranges are styled as numbers."""
+        tokens = lex("schedule add inside 6:00-22:00")
+        assert ("class:number", "6:00-22:00") in tokens
+        assert ("class:number", "50") in lex("battery 50")
+
+    def test_separators_alone_are_not_numbers(self):
+        """Separator-only words need at least one digit to be a number."""
+        assert ("class:number", "-") not in lex("battery -")
+        assert ("class:number", ":") not in lex("battery :")
+
+    def test_options(self):
+        """Known argument choices are styled as options."""
+        assert ("class:option", "on") in lex("power on")
+
+    def test_plain_text_is_coalesced(self):
+        """Adjacent unstyled whitespace and words come out as one token."""
+        tokens = SimulatorLexer().lex_document(Document("bogus foo  bar "))(0)
+        assert tokens == [("", "bogus foo  bar ")]
+
+    def test_repeated_words(self):
+        """Repeated words are each tokenized at their own position."""
+        tokens = lex("battery 5 5 5")
+        assert [t for t in tokens if t[0] == "class:number"] == [
+            ("class:number", "5"),
+            ("class:number", "5"),
+            ("class:number", "5"),
+        ]
+
+
+# ============================================================================
+# Completer Tests
+# ============================================================================
+
+class TestSimulatorCompleter:
+    """Tests for SimulatorCompleter."""
+
+    def test_empty_input_lists_all_commands(self):
+        """Empty input offers every command and alias, sorted."""
+        completions = complete("")
+        assert "status" in completions
+        assert "s" in completions
+        assert completions == sorted(completions)
+
+    def test_command_prefix(self):
+        """Command completions are filtered by prefix."""
+        completions = complete("sta")
+        assert "status" in completions
+        assert all(c.startswith("sta") for c in completions)
+
+    def test_command_prefix_is_case_insensitive(self):
+        """Uppercase input still completes lowercase commands."""
+        assert "status" in complete("STA")
+
+    def test_unknown_prefix(self):
+        """A prefix with no matches yields nothing."""
+        assert complete("zzz") == []
+
+    def test_subcommands(self):
+        """Subcommands and help are offered after a command."""
+        completions = complete("schedule ")
+        assert "add" in completions
+        assert "help" in completions
+
+    def test_subcommand_prefix(self):
+        """Subcommand completions are filtered by prefix."""
+        assert complete("schedule a") == ["add"]
+
+    def test_toggle_options(self):
+        """bool_toggle arguments offer on/off."""
+        assert complete("power o") == ["on", "off"]
+
+    def test_leaf_command_offers_nothing(self):
+        """Commands without subcommands or arguments complete nothing."""
+        assert complete("status ") == []
+
+    def test_unknown_command_offers_nothing(self):
+        """Arguments to an unknown command complete nothing."""
+        assert complete("bogus ") == []
+        assert complete("bogus o") == []
+
+    def test_dynamic_completer(self):
+        """Arguments with a completer offer its results filtered by prefix."""
+        completions = complete("run basic_")
+        assert completions
+        assert all(c.startswith("basic_") for c in completions)
+
+
+# ============================================================================
+# History Recall Tests
+# ============================================================================
+
+class TestResolveHistoryRecall:
+    """Tests for InteractiveSession.resolve_history_recall."""
+
+    @pytest.fixture
+    def session(self):
+        session = InteractiveSession(history_file="none")
+        session._history.prompt_toolkit_history.append_string("status")
+        return session
+
+    def test_plain_line_passes_through(self, session):
+        """Lines not starting with ! are returned unchanged."""
+        assert session.resolve_history_recall("power on") == ("power on", False, None)
+
+    def test_empty_line_passes_through(self, session):
+        """Empty lines are returned unchanged."""
+        assert session.resolve_history_recall("") == ("", False, None)
+
+    def test_repeat_last(self, session):
+        """!! resolves to the previous command."""
+        assert session.resolve_history_recall("!!") == ("status", True, None)
+
+    def test_recall_error(self, session):
+        """Out-of-range recalls report an error."""
+        line, recalled, error = session.resolve_history_recall("!5")
+        assert (line, recalled) == ("!5", False)
+        assert error == "Only 1 commands in history"
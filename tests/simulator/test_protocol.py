@@ -18,6 +18,7 @@ from powerpetdoor.simulator import (
     DoorTimingConfig,
     CommandRegistry,
 )
+from powerpetdoor.simulator.protocol import encode_message
 from powerpetdoor.const import (
     FIELD_SUCCESS,
     PING,
@@ -338,6 +339,45 @@ class TestDoorSimulatorProtocol:
         await asyncio.sleep(0.05)
         assert mock_transport.write.call_count > 0
 
+    def test_encode_message(self):
+        """Encoded messages should be JSON with string keys."""
+        assert json.loads(encode_message({"CMD": PONG, 1: "a"})) == {"CMD": PONG, "1": "a"}
+
+    def test_encode_message_is_ascii(self):
+        """Non-ASCII values should be escaped, as the client reads ASCII."""
+        data = encode_message({"CMD": PONG, PONG: "caf\u00e9 \u2603"})
+        assert data.isascii()
+        assert json.loads(data.decode("ascii")) == {"CMD": PONG, PONG: "caf\u00e9 \u2603"}
+
+    @pytest.mark.asyncio
+    async def test_queued_messages_coalesce(self, protocol, mock_transport):
+        """Queued messages should go out in a single write."""
+        protocol._queue(b'{"CMD": "A"}')
+        protocol._queue(b'{"CMD": "B"}')
+        assert mock_transport.write.call_count == 0
+
+        await asyncio.sleep(0)
+        mock_transport.write.assert_called_once_with(b'{"CMD": "A"}{"CMD": "B"}')
+
+    @pytest.mark.asyncio
+    async def test_queued_status_is_superseded(self, protocol, mock_transport):
+        """Only the latest queued door status should be written."""
+        protocol._queue_status(b'{"S": 1}')
+        protocol._queue(b'{"CMD": "A"}')
+        protocol._queue_status(b'{"S": 2}')
+
+        await asyncio.sleep(0)
+        mock_transport.write.assert_called_once_with(b'{"CMD": "A"}{"S": 2}')
+
+    @pytest.mark.asyncio
+    async def test_send_flushes_queue_first(self, protocol, mock_transport):
+        """A direct send should not overtake queued messages."""
+        protocol._queue(b'{"CMD": "A"}')
+        protocol._send({"CMD": "B"})
+        mock_transport.write.assert_called_once_with(
+            b'{"CMD": "A"}' + encode_message({"CMD": "B"})
+        )
+
 
 # ============================================================================
 # Connection Lifecycle Tests
@@ -382,6 +422,26 @@ class TestConnectionLifecycle:
         # Should not raise
         proto.connection_lost(None)
 
+    @pytest.mark.asyncio
+    async def test_standalone_protocol_sends_door_status(self, state, mock_transport):
+        """Without a server, door transitions are sent by the protocol."""
+        proto = DoorSimulatorProtocol(state)
+        proto.connection_made(mock_transport)
+        await proto._simulate_door_open(hold=True)
+        await asyncio.sleep(0)
+        assert mock_transport.write.call_count > 0
+
+    @pytest.mark.asyncio
+    async def test_server_broadcast_protocol_leaves_status_to_server(
+        self, state, mock_transport
+    ):
+        """With server_broadcast, the protocol does not send door status itself."""
+        proto = DoorSimulatorProtocol(state, server_broadcast=True)
+        proto.connection_made(mock_transport)
+        await proto._simulate_door_open(hold=True)
+        await asyncio.sleep(0)
+        mock_transport.write.assert_not_called()
+
 
 # ============================================================================
 # Protocol Value Conversion Tests
@@ -24,6 +24,7 @@ from powerpetdoor.simulator.scripting import (
     AssertionFailed,
     get_builtin_script,
     list_builtin_scripts,
+    script_completer,
     YAML_AVAILABLE,
 )
 from powerpetdoor.const import (
@@ -333,3 +334,9 @@ class TestBuiltinScriptInfrastructure:
             script = get_builtin_script(name)
             assert script.name is not None
             assert len(script.steps) > 0
+
+    def test_script_completer_includes_builtins(self):
+        """Completer should offer every built-in script by name."""
+        names = {name for name, _ in script_completer()}
+        for name, _ in list_builtin_scripts():
+            assert name in names
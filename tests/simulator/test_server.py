@@ -25,6 +25,11 @@ from powerpetdoor.const import (
     DOOR_STATE_SLOWING,
     DOOR_STATE_CLOSING_TOP_OPEN,
     DOOR_STATE_CLOSING_MID_OPEN,
+    CMD_POWER_OFF,
+    CMD_ENABLE_OUTSIDE_SENSOR_SAFETY_LOCK,
+    FIELD_POWER,
+    FIELD_SETTINGS,
+    FIELD_OUTSIDE_SENSOR_SAFETY_LOCK,
 )
 
 
@@ -151,6 +156,18 @@ class TestDoorSimulator:
         simulator.set_battery(-10)
         assert simulator.state.battery_percent == 0
 
+    def test_set_battery_unchanged_skips_broadcast(self, simulator):
+        """set_battery should not broadcast when the clamped value is unchanged."""
+        from unittest.mock import patch
+
+        simulator.set_battery(150)
+        with patch.object(simulator, "_schedule_battery_broadcast") as broadcast:
+            simulator.set_battery(100)
+            simulator.set_battery(200)
+            broadcast.assert_not_called()
+            simulator.set_battery(90)
+            broadcast.assert_called_once()
+
     def test_set_power(self, simulator):
         """set_power should update power state."""
         simulator.set_power(False)
@@ -228,6 +245,72 @@ class TestDoorOperationSequences:
         assert simulator.state.inside_sensor_active is False
         assert simulator.state.is_sensor_blocking_close() is False
 
+    @pytest.mark.asyncio
+    async def test_activate_sensor_duration_restarts(self, simulator):
+        """Re-activating a sensor should replace its pending deactivation."""
+        simulator.activate_sensor("inside", duration=0.05)
+        simulator.activate_sensor("inside", duration=0.3)
+
+        await asyncio.sleep(0.15)
+        assert simulator.state.inside_sensor_active is True
+
+        await asyncio.sleep(0.25)
+        assert simulator.state.inside_sensor_active is False
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_all_door_sequences(self, timing_config):
+        """stop() should cancel a sequence even after a later trigger."""
+        state = DoorSimulatorState(timing=timing_config, hold_time=1)
+        sim = DoorSimulator(port=0, state=state)
+        await sim.start()
+
+        sim.trigger_sensor("inside")
+        await asyncio.sleep(0.1)
+        assert state.door_status == DOOR_STATE_HOLDING
+        # Second trigger while holding returns at once
+        sim.trigger_sensor("inside")
+        await asyncio.sleep(0)
+
+        await sim.stop()
+        assert not sim._door_tasks
+        # The original sequence must not carry on closing the door
+        await asyncio.sleep(1.2)
+        assert state.door_status == DOOR_STATE_HOLDING
+
+    @pytest.mark.asyncio
+    async def test_stop_removes_door_status_listener(self, timing_config):
+        """stop() should detach the simulator from a caller-owned state."""
+        state = DoorSimulatorState(timing=timing_config)
+        sim = DoorSimulator(port=0, state=state)
+        await sim.start()
+        assert state.door_status_listeners == [sim._broadcast_door_status]
+
+        await sim.stop()
+        assert state.door_status_listeners == []
+
+    @pytest.mark.asyncio
+    async def test_client_door_sequence_queues_each_status_once(self, simulator):
+        """Door transitions should be broadcast once, by the state listener."""
+        from unittest.mock import patch
+
+        port = simulator.server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        await asyncio.sleep(0.05)
+
+        protocol = simulator.protocols[0]
+        try:
+            with patch.object(
+                protocol, "_queue_status", wraps=protocol._queue_status
+            ) as queue_status:
+                await simulator.open_door(hold=True)
+                await asyncio.sleep(0.2)
+                assert simulator.state.door_status == DOOR_STATE_KEEPUP
+                # RISING, SLOWING, KEEPUP
+                assert queue_status.call_count == 3
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
     @pytest.mark.asyncio
     async def test_open_and_hold_keeps_door_open(self, simulator):
         """open_door with hold=True should keep door open indefinitely."""
@@ -241,6 +324,20 @@ class TestDoorOperationSequences:
         await asyncio.sleep(0.3)
         assert simulator.state.door_status == DOOR_STATE_KEEPUP
 
+    @pytest.mark.asyncio
+    async def test_blocking_sensor_extends_hold(self, simulator):
+        """Door should hold while a sensor blocks close, then close after it clears."""
+        simulator.state.hold_time = 0.2
+        simulator.state.inside_sensor_active = True
+        task = asyncio.create_task(simulator.open_door())
+
+        await asyncio.sleep(0.5)
+        assert simulator.state.door_status == DOOR_STATE_HOLDING
+
+        simulator.state.inside_sensor_active = False
+        await asyncio.wait_for(task, timeout=1)
+        assert simulator.state.door_status == DOOR_STATE_CLOSED
+
 
 # ============================================================================
 # Battery Simulation Tests
@@ -397,6 +494,52 @@ class TestBatterySimulation:
         # Battery should not have changed
         assert sim.state.battery_percent == initial
 
+    def test_fractional_rate_accumulates(self, simulator):
+        """Sub-percent changes per tick should add up across ticks."""
+        config = BatteryConfig(discharge_rate=0.1, update_interval=60.0)
+        simulator.state.ac_present = False
+        simulator.state.battery_percent = 50
+
+        for _ in range(9):
+            simulator._simulate_battery_step(config)
+        assert simulator.state.battery_percent == 50
+
+        simulator._simulate_battery_step(config)
+        assert simulator.state.battery_percent == 49
+
+    @pytest.mark.asyncio
+    async def test_ac_toggle_resets_fractional_carry(self, simulator):
+        """Switching AC should not carry a partial discharge into charging."""
+        config = BatteryConfig(
+            charge_rate=0.1, discharge_rate=0.1, update_interval=60.0
+        )
+        simulator.state.ac_present = False
+        simulator.state.battery_percent = 50
+
+        for _ in range(9):
+            simulator._simulate_battery_step(config)
+        simulator.set_ac_present(True)
+        assert simulator._battery_carry == 0.0
+
+        for _ in range(10):
+            simulator._simulate_battery_step(config)
+        assert simulator.state.battery_percent == 51
+
+    @pytest.mark.asyncio
+    async def test_set_battery_resets_fractional_carry(self, simulator):
+        """An explicit battery level should discard any partial percent."""
+        config = BatteryConfig(discharge_rate=0.1, update_interval=60.0)
+        simulator.state.ac_present = False
+        simulator.state.battery_percent = 50
+
+        for _ in range(9):
+            simulator._simulate_battery_step(config)
+        simulator.set_battery(80)
+        assert simulator._battery_carry == 0.0
+
+        simulator._simulate_battery_step(config)
+        assert simulator.state.battery_percent == 80
+
 
 # ============================================================================
 # Client Connection Management Tests
@@ -557,3 +700,72 @@ class TestBroadcastFunctions:
         finally:
             writer.close()
             await writer.wait_closed()
+
+    @pytest.mark.asyncio
+    async def test_broadcast_all_is_one_write_per_client(self, simulator):
+        """broadcast_all should reach each client in a single write."""
+        from unittest.mock import patch
+
+        port = simulator.server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        await asyncio.sleep(0.05)
+
+        transport = simulator.protocols[0].transport
+        try:
+            with patch.object(transport, "write", wraps=transport.write) as write:
+                simulator.broadcast_all()
+                await asyncio.sleep(0)
+                assert write.call_count == 1
+                assert write.call_args[0][0].count(b'"dir"') == 7
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    @pytest.mark.asyncio
+    async def test_battery_changes_coalesce(self, simulator):
+        """Battery changes in one loop iteration should send one status frame."""
+        from unittest.mock import patch
+
+        port = simulator.server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        await asyncio.sleep(0.05)
+
+        try:
+            with patch.object(simulator, "_broadcast", wraps=simulator._broadcast) as broadcast:
+                simulator.set_battery(40)
+                simulator.set_ac_present(not simulator.state.ac_present)
+                simulator.set_battery_present(False)
+                await asyncio.sleep(0)
+                assert broadcast.call_count == 1
+                assert broadcast.call_args[0][0]["batteryPercent"] == 0
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    @pytest.mark.asyncio
+    async def test_broadcast_toggles(self, simulator):
+        """On/off broadcasts should use the right command and field layout."""
+        import json
+        from unittest.mock import patch
+
+        port = simulator.server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        await asyncio.sleep(0.05)
+
+        transport = simulator.protocols[0].transport
+        try:
+            with patch.object(transport, "write", wraps=transport.write) as write:
+                simulator.broadcast_power(False)
+                await asyncio.sleep(0)
+                msg = json.loads(write.call_args[0][0])
+                assert msg["CMD"] == CMD_POWER_OFF
+                assert msg[FIELD_POWER] == "0"
+
+                simulator.broadcast_safety_lock(True)
+                await asyncio.sleep(0)
+                msg = json.loads(write.call_args[0][0])
+                assert msg["CMD"] == CMD_ENABLE_OUTSIDE_SENSOR_SAFETY_LOCK
+                assert msg[FIELD_SETTINGS] == {FIELD_OUTSIDE_SENSOR_SAFETY_LOCK: "1"}
+        finally:
+            writer.close()
+            await writer.wait_closed()
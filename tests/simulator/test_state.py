@@ -6,6 +6,8 @@
 """Tests for simulator state module (state.py)."""
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from powerpetdoor.simulator import (
@@ -16,6 +18,7 @@ from powerpetdoor.simulator import (
 )
 from powerpetdoor.const import (
     DOOR_STATE_CLOSED,
+    DOOR_STATE_RISING,
     FIELD_POWER,
     FIELD_INSIDE,
     FIELD_AUTO,
@@ -199,6 +202,14 @@ class TestSchedule:
         assert schedule.is_day_active(0) is False
         assert schedule.is_day_active(6) is False
 
+    def test_is_day_active_after_days_change(self):
+        """Reassigning days_of_week should take effect."""
+        schedule = Schedule(index=0, enabled=True, days_of_week=[0, 1, 0, 0, 0, 0, 0])
+        assert schedule.is_day_active(1) is False  # Tuesday
+        schedule.days_of_week = [0, 0, 1, 0, 0, 0, 0]
+        assert schedule.is_day_active(1) is True
+        assert schedule.is_day_active(0) is False
+
     def test_is_sensor_allowed_inside_normal_hours(self):
         """Inside sensor should be allowed during scheduled hours."""
         schedule = Schedule(
@@ -253,6 +264,21 @@ class TestSchedule:
         # 12:00 should NOT be allowed
         assert schedule.is_sensor_allowed("inside", 12, 0, 0) is False
 
+    def test_is_sensor_allowed_after_time_change(self):
+        """Editing the time window in place should take effect."""
+        schedule = Schedule(
+            index=0,
+            enabled=True,
+            days_of_week=[1, 1, 1, 1, 1, 1, 1],
+            inside=True,
+            start_hour=6,
+            end_hour=22,
+        )
+        assert schedule.is_sensor_allowed("inside", 23, 0, 0) is False
+        schedule.end_hour = 23
+        schedule.end_min = 30
+        assert schedule.is_sensor_allowed("inside", 23, 0, 0) is True
+
 
 # ============================================================================
 # DoorSimulatorState Tests
@@ -308,6 +334,30 @@ class TestDoorSimulatorState:
         assert settings[FIELD_AUTO] == "1"
         assert FIELD_TZ in settings
 
+    def test_get_settings_cached_until_changed(self):
+        """get_settings should reuse its result until a setting changes."""
+        state = DoorSimulatorState(power=True)
+        settings = state.get_settings()
+        assert state.get_settings() is settings
+
+        state.battery_percent = 50
+        assert state.get_settings() is settings
+
+        state.power = False
+        assert state.get_settings()[FIELD_POWER] == "0"
+
+    def test_door_status_listeners(self):
+        """Listeners should fire only when door_status changes value."""
+        state = DoorSimulatorState()
+        calls = []
+        state.door_status_listeners.append(lambda: calls.append(state.door_status))
+
+        state.door_status = DOOR_STATE_CLOSED
+        assert calls == []
+
+        state.door_status = DOOR_STATE_RISING
+        assert calls == [DOOR_STATE_RISING]
+
     def test_get_notifications(self):
         """get_notifications should return notification settings."""
         state = DoorSimulatorState(
@@ -320,6 +370,9 @@ class TestDoorSimulatorState:
         assert notifications["sensorOffIndoorNotificationsEnabled"] == "0"
         assert notifications["lowBatteryNotificationsEnabled"] == "1"
 
+        state.low_battery = False
+        assert state.get_notifications()["lowBatteryNotificationsEnabled"] == "0"
+
     def test_get_schedule_list(self):
         """get_schedule_list should return list of schedule indices."""
         state = DoorSimulatorState()
@@ -350,6 +403,20 @@ class TestDoorSimulatorState:
         assert state.is_sensor_allowed_by_schedule("inside") is True
         assert state.is_sensor_allowed_by_schedule("outside") is True
 
+    def test_is_sensor_allowed_by_schedule_invalid_timezone(self):
+        """An invalid timezone should fall back to UTC rather than fail."""
+        state = DoorSimulatorState(auto=True, timezone="Not/A_Zone")
+        state.schedules[0] = Schedule(
+            index=0,
+            enabled=True,
+            inside=True,
+            start_hour=0,
+            start_min=0,
+            end_hour=23,
+            end_min=59,
+        )
+        assert state.is_sensor_allowed_by_schedule("outside") is False
+
 
 # ============================================================================
 # Sensor Detection Model Tests
@@ -479,6 +546,30 @@ class TestIsSensorBlockingClose:
         )
         assert state.is_sensor_blocking_close() is False
 
+    def test_blocking_field_change_sets_hold_changed(self):
+        """Changing a field that affects blocking should set hold_changed."""
+        state = DoorSimulatorState()
+        state.hold_changed.clear()
+        state.battery_percent = 50
+        assert not state.hold_changed.is_set()
+        state.inside_sensor_active = True
+        assert state.hold_changed.is_set()
+
+    def test_hold_changed_usable_from_another_loop(self):
+        """hold_changed should work when the state is reused under a new loop."""
+        state = DoorSimulatorState()
+
+        async def wait_for_change():
+            event = state.hold_changed
+            event.clear()
+            asyncio.get_running_loop().call_later(
+                0.01, setattr, state, "inside_sensor_active", not state.inside_sensor_active
+            )
+            await asyncio.wait_for(event.wait(), 1)
+
+        asyncio.run(wait_for_change())
+        asyncio.run(wait_for_change())
+
     def test_cmd_lockout_prevents_outside_blocking(self):
         """When cmd_lockout is enabled, outside sensor should NOT block close."""
         state = DoorSimulatorState(
@@ -497,3 +588,25 @@ class TestIsSensorBlockingClose:
             cmd_lockout=False
         )
         assert state.is_sensor_blocking_close() is True
+
+
+class TestSensorTriggerBlocked:
+    """Tests for sensor_trigger_blocked() method."""
+
+    def test_allowed_by_default(self):
+        """Enabled sensors with power on should not be blocked."""
+        state = DoorSimulatorState()
+        assert state.sensor_trigger_blocked("inside") is None
+        assert state.sensor_trigger_blocked("outside") is None
+
+    def test_power_off(self):
+        """Power off should block both sensors."""
+        state = DoorSimulatorState(power=False)
+        assert "power OFF" in state.sensor_trigger_blocked("inside")
+        assert "power OFF" in state.sensor_trigger_blocked("outside")
+
+    def test_safety_lock_blocks_outside_only(self):
+        """Safety lock should block only the outside sensor."""
+        state = DoorSimulatorState(safety_lock=True)
+        assert state.sensor_trigger_blocked("inside") is None
+        assert "safety lock" in state.sensor_trigger_blocked("outside")